@@ -1,9 +1,25 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable
 from dataclasses import dataclass
+from itertools import repeat
+import os
 from pathlib import Path
-from typing import Literal, final
+import sys
+from typing import Final, Literal, NamedTuple, final
+
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from lazy import lazy_import
+from stream import STDIN, buffer_chunks, chunks, mapped
+
+numpy: Final = lazy_import('numpy')
+
+UP: Final = ord('(')
+
+DOWN: Final = ord(')')
+
+BLOCK_SIZE: Final = 1 << 12
 
 
 @final
@@ -11,41 +27,132 @@ from typing import Literal, final
 class Arguments:
     part: Literal[1, 2]
     input_path: Path
+    jobs: int | None
 
 
 def parse_args() -> Arguments:
     parser = ArgumentParser()
     parser.add_argument('part', type=int, choices=(1, 2))
     parser.add_argument('input', type=Path)
+    parser.add_argument(
+        '-j', '--jobs', nargs='?', const=0, type=int, metavar='N'
+    )
     args = parser.parse_args()
-    return Arguments(part=args.part, input_path=args.input)
+    if args.jobs is not None and args.input == STDIN:
+        parser.error('--jobs needs a file to split, not standard input')
+    return Arguments(
+        part=args.part,
+        input_path=args.input,
+        jobs=None if args.jobs is None else args.jobs or os.cpu_count(),
+    )
+
+
+def part_1(chunks: Iterable[bytes]) -> int:
+    return sum(chunk.count(UP) - chunk.count(DOWN) for chunk in chunks)
+
+
+def find_basement(
+    chunks: Iterable[bytes], floor: int = 0, position: int = 0
+) -> int | None:
+    # Counting is far cheaper than stepping, and a block with fewer downs
+    # than the current floor cannot reach the basement whatever its order,
+    # so only the block where it happens is ever walked byte by byte.
+    for chunk in chunks:
+        downs = chunk.count(DOWN)
+        if floor - downs >= 0:
+            floor += chunk.count(UP) - downs
+            position += len(chunk)
+            continue
+        for start in range(0, len(chunk), BLOCK_SIZE):
+            block = chunk[start : start + BLOCK_SIZE]
+            downs = block.count(DOWN)
+            if floor - downs >= 0:
+                floor += block.count(UP) - downs
+                position += len(block)
+                continue
+            for offset, byte in enumerate(block, start=position + 1):
+                if byte == UP:
+                    floor += 1
+                elif byte == DOWN:
+                    floor -= 1
+                    if floor < 0:
+                        return offset
+            position += len(block)
+    return None
+
+
+def part_2(chunks: Iterable[bytes]) -> int:
+    if (position := find_basement(chunks)) is None:
+        raise RuntimeError()
+    return position
+
+
+@final
+class Shard(NamedTuple):
+    net: int
+    lowest: int
 
 
-def directions(input_path: Path) -> Iterator[Literal[1, -1]]:
-    return (1 if token == '(' else -1 for token in input_path.read_text())
+def summarise(path: Path, start: int, end: int) -> Shard:
+    """Net change and lowest floor, relative to the start, over a shard."""
+    floor = lowest = 0
+    with mapped(path) as buffer:
+        for chunk in buffer_chunks(buffer, start, end):
+            # As in find_basement, counts alone settle any chunk that cannot
+            # dip below the lowest floor so far.
+            downs = chunk.count(DOWN)
+            if floor - downs >= lowest:
+                floor += chunk.count(UP) - downs
+                continue
+            steps = numpy.frombuffer(chunk, dtype=numpy.uint8)
+            floors = numpy.cumsum(
+                (steps == UP).view(numpy.int8)
+                - (steps == DOWN).view(numpy.int8),
+                dtype=numpy.int32,
+            )
+            lowest = min(lowest, floor + int(floors.min()))
+            floor += int(floors[-1])
+    return Shard(floor, lowest)
 
 
-def part_1(directions: Iterable[int]) -> int:
-    return sum(directions)
+def part_2_parallel(path: Path, jobs: int) -> int:
+    """Part 2 as a prefix scan over ``jobs`` shards of the file.
 
+    Each worker reduces its shard to a net change and a lowest floor. Adding
+    up the nets in order gives every shard's starting floor, so the first
+    shard that dips below zero is found without stepping through the others,
+    and only that one is walked.
+    """
+    from concurrent.futures import ProcessPoolExecutor
 
-def part_2(directions: Iterable[int]) -> int:
-    floor = 0
-    for i, direction in enumerate(directions, start=1):
-        floor += direction
-        if floor < 0:
-            return i
+    size = path.stat().st_size
+    bounds = [size * i // jobs for i in range(jobs + 1)]
+    with ProcessPoolExecutor(jobs) as executor:
+        shards = executor.map(summarise, repeat(path), bounds, bounds[1:])
+        floor = 0
+        for start, end, shard in zip(bounds, bounds[1:], shards):
+            if floor + shard.lowest < 0:
+                with mapped(path) as buffer:
+                    position = find_basement(
+                        buffer_chunks(buffer, start, end), floor, start
+                    )
+                assert position is not None
+                return position
+            floor += shard.net
     raise RuntimeError()
 
 
 def main() -> None:
     args = parse_args()
+    if args.part == 2 and args.jobs is not None:
+        print(part_2_parallel(args.input_path, args.jobs))
+        return
     match args.part:
         case 1:
             part = part_1
         case 2:
             part = part_2
-    print(part(directions(args.input_path)))
+    print(part(chunks(args.input_path)))
 
 
 if __name__ == '__main__':
@@ -1,8 +1,28 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal, NamedTuple, final
+import re
+import sys
+from typing import TYPE_CHECKING, Final, Literal, final
+
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from lazy import lazy_import
+from stream import line_blocks
+
+if TYPE_CHECKING:
+    from numpy import int64
+    from numpy.typing import NDArray
+
+numpy: Final = lazy_import('numpy')
+
+BLOCK_SIZE: Final = 1 << 24
+
+CROSS: Final = ord('x')
+
+PRESENT: Final = re.compile(rb'[0-9]+x[0-9]+x[0-9]+')
 
 
 @final
@@ -20,40 +40,98 @@ def parse_args() -> Arguments:
     return Arguments(part=args.part, input_path=args.input)
 
 
-@final
-class Present(NamedTuple):
-    l: int
-    w: int
-    h: int
-
-
-type Data = list[Present]
-
-
-def load_data(path: Path) -> Data:
-    with open(path) as file:
-        return [Present(*map(int, line.split('x'))) for line in file]
-
-
-def calculate_required_wrapping_paper(present: Present) -> int:
-    l, w, h = present
-    lw = l * w
-    wh = w * h
-    hl = h * l
-    return 2 * (lw + wh + hl) + min(lw, wh, hl)
-
-
-def part_1(data: Data) -> int:
-    return sum(calculate_required_wrapping_paper(present) for present in data)
-
-
-def calculate_required_ribbon(present: Present) -> int:
-    d1, d2, d3 = sorted(present)
-    return 2 * (d1 + d2) + (d1 * d2 * d3)
-
-
-def part_2(data: Data) -> int:
-    return sum(calculate_required_ribbon(present) for present in data)
+type Presents = 'NDArray[int64]'
+
+type Data = Iterable[bytes]
+
+
+def parse_presents(block: bytes) -> Presents:
+    """``(n, 3)`` array of the ``LxWxH`` dimensions in ``block``.
+
+    Every run of digits is a number. Each digit is weighted by its power of
+    ten within its run and the runs are summed with ``reduceat``, so nothing
+    is parsed one line at a time. The separators are checked the same way,
+    and only a malformed block is gone through line by line, to name the
+    line.
+    """
+    text = numpy.frombuffer(block, dtype=numpy.uint8)
+    digits = text - ord('0')
+    is_digit = digits < 10
+    positions = numpy.flatnonzero(is_digit)
+    if not len(positions):
+        if block.strip(b'\r\n'):
+            raise ValueError(f'malformed present {find_malformed(block)!r}')
+        return numpy.zeros((0, 3), dtype=numpy.int64)
+    gaps = numpy.diff(positions) != 1
+    starts = numpy.flatnonzero(numpy.concatenate(([True], gaps)))
+    ends = numpy.append(starts[1:], len(positions))
+    if not is_well_formed(block, positions, starts, ends):
+        raise ValueError(f'malformed present {find_malformed(block)!r}')
+    digits = digits[positions].astype(numpy.int64)
+    lengths = ends - starts
+    powers = numpy.repeat(ends, lengths) - numpy.arange(len(positions)) - 1
+    values = numpy.add.reduceat(digits * 10**powers, starts)
+    return values.reshape(-1, 3)
+
+
+def is_well_formed(
+    block: bytes,
+    positions: 'NDArray[int64]',
+    starts: 'NDArray[int64]',
+    ends: 'NDArray[int64]',
+) -> bool:
+    """Whether every non-blank line of ``block`` is ``LxWxH``.
+
+    Both gaps inside each present must be a single ``x``, and every other
+    byte that is not a digit must be a line break, which ``bytes.count``
+    tallies far faster than a pass over the array.
+    """
+    if len(starts) % 3:
+        return False
+    firsts = positions[starts].reshape(-1, 3)
+    after = positions[ends - 1].reshape(-1, 3)[:, :2] + 1
+    text = numpy.frombuffer(block, dtype=numpy.uint8)
+    if not (
+        numpy.all(firsts[:, 1:] == after + 1)
+        and numpy.all(text[after] == CROSS)
+    ):
+        return False
+    breaks = block.count(b'\n') + block.count(b'\r')
+    return breaks == len(block) - len(positions) - after.size
+
+
+def find_malformed(block: bytes) -> str:
+    for line in block.split(b'\n'):
+        line = line.rstrip(b'\r')
+        if line and not PRESENT.fullmatch(line):
+            return line.decode(errors='backslashreplace')
+    return block.decode(errors='backslashreplace')
+
+
+def load_blocks(path: Path) -> Data:
+    """``path`` in blocks of whole lines, each parsed by the part.
+
+    The order list can run to 10^8 presents, so it is streamed: loading
+    only maps the file, and each block is parsed as the part reaches it.
+    """
+    return line_blocks(path, BLOCK_SIZE)
+
+
+def part_1(blocks: Data) -> int:
+    total = 0
+    for presents in map(parse_presents, blocks):
+        l, w, h = presents.T
+        sides = numpy.stack((l * w, w * h, h * l), axis=1)
+        total += int(2 * sides.sum() + sides.min(axis=1).sum())
+    return total
+
+
+def part_2(blocks: Data) -> int:
+    total = 0
+    for presents in map(parse_presents, blocks):
+        d1, d2, d3 = numpy.sort(presents, axis=1).T
+        total += int((2 * (d1 + d2) + d1 * d2 * d3).sum())
+    return total
 
 
 def main() -> None:
@@ -63,7 +141,7 @@ def main() -> None:
             part = part_1
         case 2:
             part = part_2
-    print(part(load_data(args.input_path)))
+    print(part(load_blocks(args.input_path)))
 
 
 if __name__ == '__main__':
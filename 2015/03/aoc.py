@@ -3,7 +3,23 @@ from argparse import ArgumentParser
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal, final
+import sys
+from typing import TYPE_CHECKING, Final, Literal, final
+
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from lazy import lazy_import
+from stream import chunks
+
+if TYPE_CHECKING:
+    from numpy import int64
+    from numpy.typing import NDArray
+
+numpy: Final = lazy_import('numpy')
+
+# Packed house keys are x * STRIDE + y, which is unique while |y| stays
+# below STRIDE / 2, far beyond any reachable input.
+STRIDE: Final = 1 << 32
 
 
 @final
@@ -11,58 +27,97 @@ from typing import Literal, final
 class Arguments:
     part: Literal[1, 2]
     input_path: Path
+    santas: int | None
 
 
 def parse_args() -> Arguments:
     parser = ArgumentParser()
     parser.add_argument('part', type=int, choices=(1, 2))
     parser.add_argument('input', type=Path)
+    parser.add_argument('-k', '--santas', type=int, metavar='K')
     args = parser.parse_args()
-    return Arguments(part=args.part, input_path=args.input)
-
-
-type Moves = Iterator[tuple[int, int]]
-
-
-def load_moves(path: Path) -> Moves:
-    for token in path.read_text():
-        match token:
-            case '^':
-                yield 0, -1
-            case 'v':
-                yield 0, 1
-            case '>':
-                yield 1, 0
-            case '<':
-                yield -1, 0
-
-
-def find_visited(moves: Iterable[tuple[int, int]]) -> set[tuple[int, int]]:
-    x = 0
-    y = 0
-    visited: set[tuple[int, int]] = {(x, y)}
-    for dx, dy in moves:
-        x += dx
-        y += dy
-        visited.add((x, y))
-    return visited
-
-
-def part_1(moves: Moves) -> int:
-    return len(find_visited(moves))
-
-
-def part_2(moves: Moves) -> int:
-    moves_1 = []
-    moves_2 = []
-    for move in moves:
-        moves_1.append(move)
-        moves_1, moves_2 = moves_2, moves_1
-    return len(find_visited(moves_1) | find_visited(moves_2))
+    if args.santas is not None and args.santas < 1:
+        parser.error('there must be at least one Santa')
+    return Arguments(part=args.part, input_path=args.input, santas=args.santas)
+
+
+type Houses = 'NDArray[int64]'
+
+
+def load_moves(path: Path) -> Iterator[bytes]:
+    return chunks(path)
+
+
+def step_table(moves: dict[str, int]) -> 'NDArray[int64]':
+    table = numpy.zeros(256, dtype=numpy.int64)
+    for move, step in moves.items():
+        table[ord(move)] = step
+    return table
+
+
+def unique(keys: Houses) -> Houses:
+    # Sorting and dropping repeats beats numpy.unique, which hashes first and
+    # still sorts afterwards.
+    keys = numpy.sort(keys)
+    if len(keys):
+        keys = keys[numpy.concatenate(([True], keys[1:] != keys[:-1]))]
+    return keys
+
+
+def count_houses(chunks: Iterable[bytes], santas: int = 1) -> int:
+    """Houses visited by ``santas`` Santas taking the moves in turn.
+
+    Each chunk becomes arrays of steps; every Santa's share is a strided
+    view whose cumulative sum, offset by where that Santa got to, gives the
+    houses it visits. Those are packed into single integers and reduced to a
+    sorted unique array, so memory grows with the number of distinct houses,
+    not the number of moves.
+    """
+    dx_table = step_table({'>': 1, '<': -1})
+    dy_table = step_table({'v': 1, '^': -1})
+    positions = numpy.zeros((santas, 2), dtype=numpy.int64)
+    visited: Houses = numpy.zeros(1, dtype=numpy.int64)
+    pending: list[Houses] = []
+    pending_size = 0
+    taken = 0
+    for chunk in chunks:
+        codes = numpy.frombuffer(chunk, dtype=numpy.uint8)
+        codes = codes[(dx_table[codes] != 0) | (dy_table[codes] != 0)]
+        dx = dx_table[codes]
+        dy = dy_table[codes]
+        for santa in range(santas):
+            first = (santa - taken) % santas
+            xs = numpy.cumsum(dx[first::santas]) + positions[santa, 0]
+            if not len(xs):
+                continue
+            ys = numpy.cumsum(dy[first::santas]) + positions[santa, 1]
+            positions[santa] = xs[-1], ys[-1]
+            houses = unique(xs * STRIDE + ys)
+            pending.append(houses)
+            pending_size += len(houses)
+        taken += len(codes)
+        if pending_size > len(visited):
+            visited = unique(numpy.concatenate((visited, *pending)))
+            pending.clear()
+            pending_size = 0
+    if pending:
+        visited = unique(numpy.concatenate((visited, *pending)))
+    return len(visited)
+
+
+def part_1(chunks: Iterable[bytes]) -> int:
+    return count_houses(chunks, 1)
+
+
+def part_2(chunks: Iterable[bytes]) -> int:
+    return count_houses(chunks, 2)
 
 
 def main() -> None:
     args = parse_args()
+    if args.santas is not None:
+        print(count_houses(load_moves(args.input_path), args.santas))
+        return
     match args.part:
         case 1:
             part = part_1
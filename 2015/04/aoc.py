@@ -1,10 +1,36 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from hashlib import md5
 from itertools import count
+import json
+import os
 from pathlib import Path
-from typing import Literal, final
+import sys
+from time import monotonic
+from typing import TYPE_CHECKING, Final, Literal, Self, final
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+CHECKPOINT_DIRECTORY: Final = (
+    Path(__file__).resolve(strict=True).parents[2] / '.cache' / '2015-04'
+)
+
+SAVE_INTERVAL: Final = 5.0
+
+# Nonces are searched in aligned blocks of this many, so that within a block
+# every nonce past the first thousand is one shared prefix plus a
+# three-digit suffix.
+BLOCK_SIZE: Final = 100_000
+
+SUFFIX_DIGITS: Final = 3
+
+SUFFIXES: Final = tuple(
+    f'{i:0{SUFFIX_DIGITS}}'.encode() for i in range(10**SUFFIX_DIGITS)
+)
 
 
 @final
@@ -12,35 +38,212 @@ from typing import Literal, final
 class Arguments:
     part: Literal[1, 2]
     input_path: Path
+    difficulty: int | None
+    jobs: int | None
+    checkpoint: bool
 
 
 def parse_args() -> Arguments:
     parser = ArgumentParser()
     parser.add_argument('part', type=int, choices=(1, 2))
     parser.add_argument('input', type=Path)
+    parser.add_argument('-d', '--difficulty', type=int, metavar='ZEROS')
+    parser.add_argument(
+        '-j', '--jobs', nargs='?', const=0, type=int, metavar='N'
+    )
+    parser.add_argument('-c', '--checkpoint', action='store_true')
     args = parser.parse_args()
-    return Arguments(part=args.part, input_path=args.input)
+    if args.difficulty is not None and not 0 <= args.difficulty <= 32:
+        parser.error('difficulty must be between 0 and 32 zeros')
+    return Arguments(
+        part=args.part,
+        input_path=args.input,
+        difficulty=args.difficulty,
+        jobs=None if args.jobs is None else args.jobs or os.cpu_count(),
+        checkpoint=args.checkpoint,
+    )
+
+
+def digest_limit(zeros: int) -> bytes:
+    """Digests below this, compared as bytes, start with ``zeros`` zeros."""
+    if not zeros:
+        # Longer than a digest and all ones, so above every one of them.
+        return b'\xff' * 17
+    return (16 ** (32 - zeros)).to_bytes(16, 'big')
+
+
+def search_block(key: bytes, zeros: int, block: int) -> int | None:
+    """Smallest nonce in ``block`` whose hash has ``zeros`` leading zeros.
+
+    The key is hashed once and copied per nonce rather than rehashed, and
+    the digest is checked as raw bytes instead of formatting it as hex.
+    """
+    limit = digest_limit(zeros)
+    start = block * BLOCK_SIZE
+    keyed = md5(key, usedforsecurity=False)
+    if not start:
+        for nonce in range(10**SUFFIX_DIGITS):
+            hasher = keyed.copy()
+            hasher.update(str(nonce).encode())
+            if hasher.digest() < limit:
+                return nonce
+    step = 10**SUFFIX_DIGITS
+    for head in range(max(start, step) // step, (start + BLOCK_SIZE) // step):
+        prefixed = keyed.copy()
+        prefixed.update(str(head).encode())
+        for tail, suffix in enumerate(SUFFIXES):
+            hasher = prefixed.copy()
+            hasher.update(suffix)
+            if hasher.digest() < limit:
+                return head * step + tail
+    return None
+
+
+def leading_zeros(key: bytes, nonce: int) -> int:
+    digest = md5(key + str(nonce).encode(), usedforsecurity=False).hexdigest()
+    return len(digest) - len(digest.lstrip('0'))
+
+
+@final
+@dataclass(kw_only=True, slots=True)
+class Checkpoint:
+    """What is already known about one key's hashes, kept across runs.
+
+    ``hits[z]`` is the smallest nonce with at least ``z`` leading zeros.
+    ``searched[z]`` means no nonce below it has ``z`` or more, which also
+    rules out every higher difficulty. A hit with exactly ``k`` zeros is
+    such a bound for ``k + 1``, so part 2 starts where part 1 stopped.
+    """
+
+    path: Path
+    hits: dict[int, int] = field(default_factory=dict)
+    searched: dict[int, int] = field(default_factory=dict)
+    saved: float = field(default_factory=monotonic)
+
+    @classmethod
+    def load(cls, key: bytes, directory: Path = CHECKPOINT_DIRECTORY) -> Self:
+        path = directory / f'{key.hex()}.json'
+        try:
+            data = json.loads(path.read_text())
+            return cls(
+                path=path,
+                hits={int(z): int(n) for z, n in data['hits'].items()},
+                searched={int(z): int(n) for z, n in data['searched'].items()},
+            )
+        except FileNotFoundError:
+            return cls(path=path)
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            # A checkpoint is only ever a head start, so a corrupt one is
+            # dropped rather than trusted; the next save replaces it.
+            print(
+                f'ignoring corrupt checkpoint {path}: {error!r}',
+                file=sys.stderr,
+            )
+            return cls(path=path)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(f'.{os.getpid()}.tmp')
+        temporary.write_text(
+            json.dumps({'hits': self.hits, 'searched': self.searched})
+        )
+        os.replace(temporary, self.path)
+        self.saved = monotonic()
+
+    def resume(self, zeros: int) -> int:
+        """Lowest nonce that could still have ``zeros`` leading zeros."""
+        return max(
+            (n for z, n in self.searched.items() if z <= zeros), default=0
+        )
+
+    def miss(self, zeros: int, end: int) -> None:
+        self.searched[zeros] = max(self.searched.get(zeros, 0), end)
+        if monotonic() - self.saved >= SAVE_INTERVAL:
+            self.save()
+
+    def hit(self, zeros: int, nonce: int, found: int) -> None:
+        for z in range(zeros, found + 1):
+            self.hits[z] = nonce
+        self.searched[found + 1] = max(
+            self.searched.get(found + 1, 0), nonce + 1
+        )
+        self.save()
+
+
+def search(
+    key: bytes, zeros: int, jobs: int | None, first: int
+) -> Iterator[tuple[int, int | None]]:
+    """Blocks from ``first`` on, in order, each with its first hit if any.
+
+    With ``jobs``, blocks are farmed out to a process pool a few at a time
+    per worker, but their results are still yielded in block order, so the
+    first hit is the smallest nonce however the workers race.
+    """
+    blocks = count(first)
+    if jobs is None:
+        for block in blocks:
+            yield block, search_block(key, zeros, block)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(jobs) as executor:
+        pending: deque[tuple[int, Future[int | None]]] = deque()
+        try:
+            for block in blocks:
+                pending.append(
+                    (block, executor.submit(search_block, key, zeros, block))
+                )
+                if len(pending) < 2 * jobs:
+                    continue
+                block, future = pending.popleft()
+                yield block, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
 
 
-def find_n_leading_zeroes(key: bytes, n: int) -> int:
-    prefix = '0' * n
-    for i in count():
-        result = md5(key + str(i).encode(), usedforsecurity=False)
-        if result.hexdigest().startswith(prefix):
-            return i
+def mine(
+    key: bytes,
+    zeros: int,
+    jobs: int | None = None,
+    checkpoint: Checkpoint | None = None,
+) -> int:
+    """Smallest nonce whose hash has ``zeros`` leading zeros."""
+    first = 0
+    if checkpoint is not None:
+        if (nonce := checkpoint.hits.get(zeros)) is not None:
+            return nonce
+        first = checkpoint.resume(zeros) // BLOCK_SIZE
+    for block, nonce in search(key, zeros, jobs, first):
+        if nonce is not None:
+            if checkpoint is not None:
+                checkpoint.hit(zeros, nonce, leading_zeros(key, nonce))
+            return nonce
+        if checkpoint is not None:
+            checkpoint.miss(zeros, (block + 1) * BLOCK_SIZE)
     raise AssertionError()
 
 
 def part_1(key: bytes) -> int:
-    return find_n_leading_zeroes(key, 5)
+    return mine(key, 5)
 
 
 def part_2(key: bytes) -> int:
-    return find_n_leading_zeroes(key, 6)
+    return mine(key, 6)
 
 
 def main() -> None:
     args = parse_args()
+    if args.difficulty is not None or args.jobs is not None or args.checkpoint:
+        zeros = 4 + args.part if args.difficulty is None else args.difficulty
+        key = args.input_path.read_bytes().strip()
+        checkpoint = Checkpoint.load(key) if args.checkpoint else None
+        try:
+            print(mine(key, zeros, args.jobs, checkpoint))
+        finally:
+            if checkpoint is not None:
+                checkpoint.save()
+        return
     match args.part:
         case 1:
             part = part_1
@@ -1,10 +1,31 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser
-from collections import defaultdict
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from itertools import repeat
+import os
 from pathlib import Path
-from typing import Literal, final
+import sys
+from typing import TYPE_CHECKING, Final, Literal, final
+
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from lazy import lazy_import
+from stream import buffer_line_blocks, line_blocks, line_bounds, mapped
+
+if TYPE_CHECKING:
+    from numpy import bool_, int64, uint8
+    from numpy.typing import NDArray
+
+numpy: Final = lazy_import('numpy')
+
+NEWLINE: Final = ord('\n')
+
+VOWELS: Final = b'aeiou'
+
+FORBIDDEN: Final = (b'ab', b'cd', b'pq', b'xy')
+
+BLOCK_SIZE: Final = 1 << 22
 
 
 @final
@@ -12,73 +33,131 @@ from typing import Literal, final
 class Arguments:
     part: Literal[1, 2]
     input_path: Path
+    jobs: int | None
 
 
 def parse_args() -> Arguments:
     parser = ArgumentParser()
     parser.add_argument('part', type=int, choices=(1, 2))
     parser.add_argument('input', type=Path)
+    parser.add_argument(
+        '-j', '--jobs', nargs='?', const=0, type=int, metavar='N'
+    )
     args = parser.parse_args()
-    return Arguments(part=args.part, input_path=args.input)
-
-
-def iter_words(path: Path) -> Iterator[str]:
-    with open(path) as file:
-        for line in file:
-            yield line.strip()
-
-
-def is_nice_v1(word: str) -> bool:
-    prev_c = ''
-    has_double = False
-    vowels = 0
-    for c in word:
-        if (
-            (prev_c == 'a' and c == 'b')
-            or (prev_c == 'c' and c == 'd')
-            or (prev_c == 'p' and c == 'q')
-            or (prev_c == 'x' and c == 'y')
-        ):
-            return False
-        if c == prev_c:
-            has_double = True
-        if c in {'a', 'e', 'i', 'o', 'u'}:
-            vowels += 1
-        prev_c = c
-    return has_double and vowels >= 3
-
-
-def is_nice_v2(word: str) -> bool:
-    c_1 = ''
-    c_2 = ''
-    c_3 = ''
-    pairs: set[str] = set()
-    rule_1 = rule_2 = False
-    for c in word:
-        if not rule_1:
-            pairs.add(f'{c_3}{c_2}')
-            if f'{c_1}{c}' in pairs:
-                rule_1 = True
-        if not rule_2 and c == c_2:
-            rule_2 = True
-        if rule_1 and rule_2:
-            return True
-        c_3, c_2, c_1 = c_2, c_1, c
-    return False
+    return Arguments(
+        part=args.part,
+        input_path=args.input,
+        jobs=None if args.jobs is None else args.jobs or os.cpu_count(),
+    )
+
+
+def load_blocks(path: Path) -> Iterable[bytes]:
+    return line_blocks(path, BLOCK_SIZE)
+
+
+def split_lines(
+    block: bytes,
+) -> tuple['NDArray[uint8]', 'NDArray[bool_]', 'NDArray[int64]', int]:
+    """Bytes of ``block``, its line breaks, each byte's line and the count.
+
+    Every rule is then a mask over neighbouring bytes, with the pairs that
+    straddle a line break masked out, scattered onto lines by index.
+    """
+    if not block.endswith(b'\n'):
+        block += b'\n'
+    letters = numpy.frombuffer(block, dtype=numpy.uint8)
+    breaks = letters == NEWLINE
+    line = numpy.cumsum(breaks, dtype=numpy.int64)
+    line -= breaks
+    return letters, breaks, line, int(line[-1]) + 1
+
+
+def pair_codes(letters: 'NDArray[uint8]') -> 'NDArray[int64]':
+    return (letters[:-1].astype(numpy.int64) << 8) | letters[1:]
+
+
+def count_nice_v1(block: bytes) -> int:
+    """Lines with three vowels and a double letter but no forbidden pair."""
+    letters, breaks, line, lines = split_lines(block)
+    vowel = numpy.zeros(256, dtype=bool)
+    vowel[list(VOWELS)] = True
+    forbidden = numpy.zeros(1 << 16, dtype=bool)
+    forbidden[[pair[0] << 8 | pair[1] for pair in FORBIDDEN]] = True
+    vowels = numpy.bincount(line[vowel[letters]], minlength=lines)
+    nice = numpy.zeros(lines, dtype=bool)
+    nice[line[:-1][(letters[:-1] == letters[1:]) & ~breaks[:-1]]] = True
+    nice[line[:-1][forbidden[pair_codes(letters)]]] = False
+    return int(numpy.count_nonzero(nice & (vowels >= 3)))
+
+
+def count_nice_v2(block: bytes) -> int:
+    """Lines with a letter repeated one apart and a pair seen twice apart.
+
+    The pair rule needs the first and last place each (line, pair) occurs,
+    which takes a sort, so it is only worked out for lines that already
+    pass the cheap rule. Two places at least two apart cannot overlap.
+    """
+    letters, breaks, line, lines = split_lines(block)
+    gap = numpy.zeros(lines, dtype=bool)
+    gap[
+        line[:-2][(letters[:-2] == letters[2:]) & ~breaks[:-2] & ~breaks[1:-1]]
+    ] = True
+    places = numpy.flatnonzero(~breaks[:-1] & ~breaks[1:] & gap[line[:-1]])
+    if not len(places):
+        return 0
+    keys = line[places] << 16 | pair_codes(letters)[places]
+    order = numpy.argsort(keys, kind='stable')
+    keys = keys[order]
+    places = places[order]
+    ends = numpy.flatnonzero(keys[1:] != keys[:-1])
+    firsts = numpy.concatenate(([0], ends + 1))
+    lasts = numpy.append(ends, len(keys) - 1)
+    twice = places[lasts] - places[firsts] >= 2
+    return len(numpy.unique(keys[firsts[twice]] >> 16))
+
+
+def part_1(blocks: Iterable[bytes]) -> int:
+    return sum(map(count_nice_v1, blocks))
+
+
+def part_2(blocks: Iterable[bytes]) -> int:
+    return sum(map(count_nice_v2, blocks))
+
+
+def count_shard(
+    path: Path, start: int, end: int, count: Callable[[bytes], int]
+) -> int:
+    with mapped(path) as buffer:
+        blocks = buffer_line_blocks(buffer, start, end, BLOCK_SIZE)
+        return sum(map(count, blocks))
+
+
+def count_parallel(path: Path, part: Literal[1, 2], jobs: int) -> int:
+    """Either part over ``jobs`` spans of whole lines, one per worker."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    count = count_nice_v1 if part == 1 else count_nice_v2
+    with mapped(path) as buffer:
+        bounds = line_bounds(buffer, jobs)
+    with ProcessPoolExecutor(jobs) as executor:
+        return sum(
+            executor.map(
+                count_shard, repeat(path), bounds, bounds[1:], repeat(count)
+            )
+        )
 
 
 def main() -> None:
     args = parse_args()
+    if args.jobs is not None:
+        print(count_parallel(args.input_path, args.part, args.jobs))
+        return
     match args.part:
         case 1:
-            is_nice = is_nice_v1
+            part = part_1
         case 2:
-            is_nice = is_nice_v2
-    nice_count = 0
-    for word in iter_words(args.input_path):
-        nice = is_nice(word)
-        nice_count += nice
-    print(nice_count)
+            part = part_2
+    print(part(load_blocks(args.input_path)))
 
 
 if __name__ == '__main__':
@@ -1,11 +1,27 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum, auto, unique
 from pathlib import Path
-from typing import Literal, NamedTuple, final
+import sys
+from typing import TYPE_CHECKING, Final, Literal, NamedTuple, final
 
-from rich import print
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from lazy import lazy_import
+from stream import file_integers
+
+if TYPE_CHECKING:
+    from numpy import int32, int64, uint8
+    from numpy.typing import NDArray
+
+numpy: Final = lazy_import('numpy')
+rich: Final = lazy_import('rich')
+
+SIZE: Final = 1000
+
+MAX_SIZE: Final = 10**9
 
 
 @final
@@ -13,14 +29,25 @@ from rich import print
 class Arguments:
     part: Literal[1, 2]
     input_path: Path
+    size: int | None
+    queries_path: Path | None
 
 
 def parse_args() -> Arguments:
     parser = ArgumentParser()
     parser.add_argument('part', type=int, choices=(1, 2))
     parser.add_argument('input', type=Path)
+    parser.add_argument('-s', '--size', type=int, metavar='N')
+    parser.add_argument('-q', '--queries', type=Path, metavar='PATH')
     args = parser.parse_args()
-    return Arguments(part=args.part, input_path=args.input)
+    if args.size is not None and not 0 < args.size <= MAX_SIZE:
+        parser.error(f'--size must be from 1 to {MAX_SIZE}')
+    return Arguments(
+        part=args.part,
+        input_path=args.input,
+        size=args.size,
+        queries_path=args.queries,
+    )
 
 
 @final
@@ -96,66 +123,263 @@ def load_instructions(path: Path):
         return [parse_instruction(line) for line in file]
 
 
-def part_1(instructions: list[Instruction]) -> int:
-    grid = [[False] * 1000 for _ in range(1000)]
-    count = 0
+def switch(
+    instructions: Iterable[Instruction], shape: tuple[int, int] = (SIZE, SIZE)
+) -> 'NDArray[uint8]':
+    """Final on (1) or off (0) state of a grid of ``shape`` rows by columns."""
+    grid = numpy.zeros(shape, dtype=numpy.uint8)
     for action, start, end in instructions:
-        for y in range(start.y, end.y + 1):
-            row = grid[y]
-            for x in range(start.x, end.x + 1):
-                state = row[x]
-                match action:
-                    case Action.OFF:
-                        if state:
-                            state = False
-                            count -= 1
-                    case Action.ON:
-                        if not state:
-                            state = True
-                            count += 1
-                        state = True
-                    case Action.TOGGLE:
-                        if state:
-                            state = False
-                            count -= 1
-                        else:
-                            state = True
-                            count += 1
-                row[x] = state
-    return count
+        lights = grid[start.y : end.y + 1, start.x : end.x + 1]
+        match action:
+            case Action.OFF:
+                lights[...] = 0
+            case Action.ON:
+                lights[...] = 1
+            case Action.TOGGLE:
+                lights ^= 1
+    return grid
 
 
-def part_2(instructions: list[Instruction]) -> int:
-    grid = [[0] * 1000 for _ in range(1000)]
-    total_brightness = 0
+def dim(
+    instructions: Iterable[Instruction], shape: tuple[int, int] = (SIZE, SIZE)
+) -> 'NDArray[int32]':
+    """Final brightness of a grid of ``shape`` rows by columns."""
+    grid = numpy.zeros(shape, dtype=numpy.int32)
     for action, start, end in instructions:
-        for y in range(start.y, end.y + 1):
-            row = grid[y]
-            for x in range(start.x, end.x + 1):
-                brightness = row[x]
-                match action:
-                    case Action.OFF:
-                        if brightness:
-                            brightness -= 1
-                            total_brightness -= 1
-                    case Action.ON:
-                        brightness += 1
-                        total_brightness += 1
-                    case Action.TOGGLE:
-                        brightness += 2
-                        total_brightness += 2
-                row[x] = brightness
-    return total_brightness
+        lights = grid[start.y : end.y + 1, start.x : end.x + 1]
+        match action:
+            case Action.OFF:
+                lights -= 1
+                numpy.maximum(lights, 0, out=lights)
+            case Action.ON:
+                lights += 1
+            case Action.TOGGLE:
+                lights += 2
+    return grid
+
+
+def part_1(instructions: list[Instruction]) -> int:
+    return int(numpy.count_nonzero(switch(instructions)))
+
+
+def part_2(instructions: list[Instruction]) -> int:
+    return int(dim(instructions).sum(dtype=numpy.int64))
+
+
+@final
+class Compressed(NamedTuple):
+    """Instructions on a grid cut into blocks no instruction splits.
+
+    Block ``(i, j)`` covers columns ``xs[i]`` up to ``xs[i + 1]`` and rows
+    ``ys[j]`` up to ``ys[j + 1]``, and ``instructions`` address blocks
+    rather than lights. Every light in a block is always in the same state,
+    so a grid of blocks weighted by their areas stands in for the whole one.
+    """
+
+    instructions: list[Instruction]
+    xs: 'NDArray[int64]'
+    ys: 'NDArray[int64]'
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.ys) - 1, len(self.xs) - 1
+
+
+def compress(instructions: list[Instruction], size: int) -> Compressed:
+    for _, start, end in instructions:
+        if not 0 <= start.x <= end.x < size or not 0 <= start.y <= end.y < size:
+            raise ValueError(f'{start} through {end} is not on the grid')
+    xs = numpy.unique(
+        [0, size, *(i.start.x for i in instructions)]
+        + [i.end.x + 1 for i in instructions]
+    )
+    ys = numpy.unique(
+        [0, size, *(i.start.y for i in instructions)]
+        + [i.end.y + 1 for i in instructions]
+    )
+    blocks = [
+        Instruction(
+            action,
+            Cell(
+                int(numpy.searchsorted(xs, start.x)),
+                int(numpy.searchsorted(ys, start.y)),
+            ),
+            Cell(
+                int(numpy.searchsorted(xs, end.x + 1)) - 1,
+                int(numpy.searchsorted(ys, end.y + 1)) - 1,
+            ),
+        )
+        for action, start, end in instructions
+    ]
+    return Compressed(blocks, xs, ys)
+
+
+def weighted_total(
+    grid: 'NDArray[uint8] | NDArray[int32]', compressed: Compressed
+) -> int:
+    # A row of blocks stays well inside int64, but rows times their heights
+    # can pass it on the largest grids, so those are added as Python ints.
+    rows = grid @ numpy.diff(compressed.xs)
+    return sum(
+        int(row) * int(height)
+        for row, height in zip(rows, numpy.diff(compressed.ys))
+    )
+
+
+def part_1_compressed(instructions: list[Instruction], size: int) -> int:
+    compressed = compress(instructions, size)
+    return weighted_total(
+        switch(compressed.instructions, compressed.shape), compressed
+    )
+
+
+def part_2_compressed(instructions: list[Instruction], size: int) -> int:
+    compressed = compress(instructions, size)
+    return weighted_total(
+        dim(compressed.instructions, compressed.shape), compressed
+    )
+
+
+@final
+class LightMap:
+    """Lights on, or total brightness, in any rectangle of a final grid.
+
+    Built over a grid of blocks from ``compress``. Summed-area tables give
+    the total below and left of any block corner. Past a corner, the total
+    grows linearly along the partial column and row of blocks and with the
+    area of the partial block, so those get prefix sums of their own and a
+    query from the origin is four lookups into them. Any rectangle is then
+    four such queries, in O(log n) for the block search.
+    """
+
+    __slots__ = ('_areas', '_columns', '_rows', '_values', '_xs', '_ys')
+
+    def __init__(
+        self, grid: 'NDArray[uint8] | NDArray[int32]', compressed: Compressed
+    ) -> None:
+        xs = compressed.xs
+        ys = compressed.ys
+        widths = numpy.diff(xs)
+        heights = numpy.diff(ys)
+        # Brightness over most of a 10^9 grid passes int64, so such totals
+        # are kept exact as Python ints at some cost in speed.
+        bound = int(grid.max(initial=0)) * int(xs[-1]) * int(ys[-1])
+        dtype = numpy.int64 if bound < 1 << 63 else object
+        values = numpy.zeros((len(ys), len(xs)), dtype=dtype)
+        values[:-1, :-1] = grid
+        columns = numpy.zeros_like(values)
+        numpy.cumsum(values[:-1] * heights[:, None], axis=0, out=columns[1:])
+        rows = numpy.zeros_like(values)
+        numpy.cumsum(values[:, :-1] * widths, axis=1, out=rows[:, 1:])
+        areas = numpy.zeros_like(values)
+        numpy.cumsum(columns[:, :-1] * widths, axis=1, out=areas[:, 1:])
+        self._xs: Final = xs
+        self._ys: Final = ys
+        self._values: Final = values
+        self._columns: Final = columns
+        self._rows: Final = rows
+        self._areas: Final = areas
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return int(self._xs[-1]), int(self._ys[-1])
+
+    def _below(
+        self, x: 'NDArray[int64]', y: 'NDArray[int64]'
+    ) -> 'NDArray[int64]':
+        """Totals over ``0 <= column < x`` and ``0 <= row < y``."""
+        i = numpy.searchsorted(self._xs, x, side='right') - 1
+        j = numpy.searchsorted(self._ys, y, side='right') - 1
+        dx = x - self._xs[i]
+        dy = y - self._ys[j]
+        return (
+            self._areas[j, i]
+            + dx * self._columns[j, i]
+            + dy * self._rows[j, i]
+            + dx * dy * self._values[j, i]
+        )
+
+    def totals(
+        self,
+        starts_x: 'NDArray[int64]',
+        starts_y: 'NDArray[int64]',
+        ends_x: 'NDArray[int64]',
+        ends_y: 'NDArray[int64]',
+    ) -> 'NDArray[int64]':
+        """Totals over a batch of rectangles, given by inclusive corners."""
+        width, height = self.size
+        if (
+            (starts_x < 0).any()
+            or (starts_y < 0).any()
+            or (ends_x < starts_x).any()
+            or (ends_y < starts_y).any()
+            or (ends_x >= width).any()
+            or (ends_y >= height).any()
+        ):
+            raise ValueError('rectangle is not on the grid')
+        return (
+            self._below(ends_x + 1, ends_y + 1)
+            - self._below(starts_x, ends_y + 1)
+            - self._below(ends_x + 1, starts_y)
+            + self._below(starts_x, starts_y)
+        )
+
+    def total(self, start: Cell, end: Cell) -> int:
+        return int(
+            self.totals(
+                numpy.array([start.x]),
+                numpy.array([start.y]),
+                numpy.array([end.x]),
+                numpy.array([end.y]),
+            )[0]
+        )
+
+
+def light_map(
+    instructions: list[Instruction], part: Literal[1, 2], size: int = SIZE
+) -> LightMap:
+    compressed = compress(instructions, size)
+    grid: NDArray[uint8] | NDArray[int32]
+    match part:
+        case 1:
+            grid = switch(compressed.instructions, compressed.shape)
+        case 2:
+            grid = dim(compressed.instructions, compressed.shape)
+    return LightMap(grid, compressed)
+
+
+def load_queries(path: Path) -> 'NDArray[int64]':
+    """Rectangles as rows of ``x1 y1 x2 y2``, however they are punctuated."""
+    integers = numpy.fromiter(file_integers(path), dtype=numpy.int64)
+    return integers.reshape(-1, 4)
 
 
 def main() -> None:
     args = parse_args()
+    if args.queries_path is not None:
+        lights = light_map(
+            load_instructions(args.input_path),
+            args.part,
+            SIZE if args.size is None else args.size,
+        )
+        queries = load_queries(args.queries_path)
+        totals = lights.totals(*queries.T)
+        sys.stdout.write(''.join(f'{total}\n' for total in totals.tolist()))
+        return
+    if args.size is not None:
+        instructions = load_instructions(args.input_path)
+        match args.part:
+            case 1:
+                rich.print(part_1_compressed(instructions, args.size))
+            case 2:
+                rich.print(part_2_compressed(instructions, args.size))
+        return
     match args.part:
         case 1:
             part = part_1
         case 2:
             part = part_2
-    print(part(load_instructions(args.input_path)))
+    rich.print(part(load_instructions(args.input_path)))
 
 
 if __name__ == '__main__':
@@ -1,11 +1,35 @@
 #!/usr/bin/env python
 from abc import ABC, abstractmethod
 from argparse import ArgumentParser
+from collections import deque
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from enum import Enum, auto, unique
+from heapq import heappop, heappush
 from pathlib import Path
 import re
-from typing import ClassVar, Final, Literal, NamedTuple, final, override
+import sys
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    Final,
+    Literal,
+    NamedTuple,
+    final,
+    override,
+)
+
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from lazy import lazy_import
+
+if TYPE_CHECKING:
+    from numpy import uint16
+    from numpy.typing import NDArray
+
+numpy: Final = lazy_import('numpy')
+
+MASK: Final = 0xFFFF
 
 
 @final
@@ -23,14 +47,46 @@ def parse_args() -> Arguments:
     return Arguments(part=args.part, input_path=args.input)
 
 
+@final
+@unique
+class Opcode(Enum):
+    SET = auto()
+    COPY = auto()
+    NOT = auto()
+    OR = auto()
+    AND = auto()
+    AND_CONSTANT = auto()
+    LSHIFT = auto()
+    RSHIFT = auto()
+
+
+@final
+class Instruction(NamedTuple):
+    """One gate, writing the register after those of the gates before it.
+
+    ``a`` and ``b`` are registers, except for the constant of ``SET`` and
+    ``AND_CONSTANT`` (in ``a``) and the shift amount (in ``b``).
+    """
+
+    opcode: Opcode
+    a: int = 0
+    b: int = 0
+
+
 class Node(ABC):
     def get_value(self) -> int: ...
 
 
 class BaseComponent(Node):
+    INPUTS: ClassVar = 1
+
     @abstractmethod
     def get_int_value(self) -> int: ...
 
+    @abstractmethod
+    def compile(self, registers: Mapping['Wire', int]) -> Instruction:
+        """Instruction for this gate, its inputs read from ``registers``."""
+
     @override
     def get_value(self) -> int:
         return self.get_int_value() & 0xFFFF
@@ -38,7 +94,7 @@ class BaseComponent(Node):
 
 @final
 class Wire(Node):
-    _name_pattern: ClassVar = re.compile(r'\A[a-z]{1,2}\Z')
+    _name_pattern: ClassVar = re.compile(r'\A[a-z]+\Z')
 
     def __init__(self, name: str) -> None:
         if self._name_pattern.match(name) is None:
@@ -78,6 +134,10 @@ class ZeroComponent(BaseComponent):
     def get_int_value(self) -> int:
         raise RuntimeError()
 
+    @override
+    def compile(self, registers: Mapping[Wire, int]) -> Instruction:
+        raise RuntimeError()
+
 
 ZERO_COMPONENT: Final = ZeroComponent()
 
@@ -90,6 +150,8 @@ class Component(BaseComponent):
 
 @final
 class Input(Component):
+    INPUTS = 0
+
     def __init__(self, value: int, output: Wire) -> None:
         super().__init__(output)
         self.value = value
@@ -102,6 +164,10 @@ class Input(Component):
     def get_int_value(self) -> int:
         return self.value
 
+    @override
+    def compile(self, registers: Mapping[Wire, int]) -> Instruction:
+        return Instruction(Opcode.SET, self.value & MASK)
+
 
 class Component1(Component):
     def __init__(self, input: Wire, output: Wire) -> None:
@@ -120,6 +186,10 @@ class Join(Component1):
     def get_int_value(self) -> int:
         return self.input.get_value()
 
+    @override
+    def compile(self, registers: Mapping[Wire, int]) -> Instruction:
+        return Instruction(Opcode.COPY, registers[self.input])
+
 
 @final
 class Not(Component1):
@@ -131,8 +201,14 @@ class Not(Component1):
     def get_int_value(self) -> int:
         return ~self.input.get_value()
 
+    @override
+    def compile(self, registers: Mapping[Wire, int]) -> Instruction:
+        return Instruction(Opcode.NOT, registers[self.input])
+
 
 class Component2(Component):
+    INPUTS = 2
+
     def __init__(self, input_1: Wire, input_2: Wire, output: Wire) -> None:
         super().__init__(output)
         self.input_1: Final = input_1
@@ -151,6 +227,12 @@ class Or(Component2):
     def get_int_value(self) -> int:
         return self.input_1.get_value() | self.input_2.get_value()
 
+    @override
+    def compile(self, registers: Mapping[Wire, int]) -> Instruction:
+        return Instruction(
+            Opcode.OR, registers[self.input_1], registers[self.input_2]
+        )
+
 
 @final
 class And(Component2):
@@ -162,6 +244,12 @@ class And(Component2):
     def get_int_value(self) -> int:
         return self.input_1.get_value() & self.input_2.get_value()
 
+    @override
+    def compile(self, registers: Mapping[Wire, int]) -> Instruction:
+        return Instruction(
+            Opcode.AND, registers[self.input_1], registers[self.input_2]
+        )
+
 
 @final
 class AndConstant(BaseComponent):
@@ -180,6 +268,12 @@ class AndConstant(BaseComponent):
     def get_int_value(self) -> int:
         return self.constant & self.input.get_value()
 
+    @override
+    def compile(self, registers: Mapping[Wire, int]) -> Instruction:
+        return Instruction(
+            Opcode.AND_CONSTANT, self.constant & MASK, registers[self.input]
+        )
+
 
 class Component1o(Component):
     def __init__(self, input_1: Wire, operand: int, output: Wire) -> None:
@@ -199,6 +293,10 @@ class LShift(Component1o):
     def get_int_value(self) -> int:
         return self.input.get_value() << self.operand
 
+    @override
+    def compile(self, registers: Mapping[Wire, int]) -> Instruction:
+        return Instruction(Opcode.LSHIFT, registers[self.input], self.operand)
+
 
 @final
 class RShift(Component1o):
@@ -210,6 +308,10 @@ class RShift(Component1o):
     def get_int_value(self) -> int:
         return self.input.get_value() >> self.operand
 
+    @override
+    def compile(self, registers: Mapping[Wire, int]) -> Instruction:
+        return Instruction(Opcode.RSHIFT, registers[self.input], self.operand)
+
 
 @final
 class Circuit(NamedTuple):
@@ -264,7 +366,187 @@ def load_circuit(path: Path) -> Circuit:
     return Circuit(dict(wires), nodes)
 
 
+@final
+class Program(NamedTuple):
+    """A circuit flattened into gates in dependency order.
+
+    ``code[i]`` computes the value of ``wires[i]`` from constants and the
+    registers before it, so one pass in order settles every wire without
+    recursing.
+    """
+
+    wires: Sequence[Wire]
+    registers: Mapping[str, int]
+    code: Sequence[Instruction]
+
+    def run(self) -> list[int]:
+        """Value of every wire, by register."""
+        values: list[int] = []
+        append = values.append
+        for instruction in self.code:
+            append(execute(instruction, values))
+        return values
+
+    def run_batch(
+        self, values: Mapping[str, 'NDArray[uint16]']
+    ) -> 'NDArray[uint16]':
+        """Every wire's value in each of a batch of scenarios.
+
+        ``values`` drives some wires, typically the inputs, with one value
+        per scenario instead of their gates. The result has a row per
+        register and a column per scenario, and each gate is a single
+        NumPy operation over its row; 16-bit lanes wrap shifts and ``NOT``
+        the way the circuit does.
+        """
+        driven = {self.registers[name]: row for name, row in values.items()}
+        scenarios = len(next(iter(values.values()), ()))
+        rows = numpy.empty((len(self.code), scenarios), dtype=numpy.uint16)
+        for register, (opcode, a, b) in enumerate(self.code):
+            row = rows[register]
+            if register in driven:
+                row[...] = driven[register]
+                continue
+            match opcode:
+                case Opcode.SET:
+                    row[...] = a
+                case Opcode.COPY:
+                    row[...] = rows[a]
+                case Opcode.NOT:
+                    numpy.invert(rows[a], out=row)
+                case Opcode.OR:
+                    numpy.bitwise_or(rows[a], rows[b], out=row)
+                case Opcode.AND:
+                    numpy.bitwise_and(rows[a], rows[b], out=row)
+                case Opcode.AND_CONSTANT:
+                    numpy.bitwise_and(rows[b], a, out=row)
+                case Opcode.LSHIFT:
+                    numpy.left_shift(rows[a], b, out=row)
+                case Opcode.RSHIFT:
+                    numpy.right_shift(rows[a], b, out=row)
+        return rows
+
+
+def execute(instruction: Instruction, values: Sequence[int]) -> int:
+    opcode, a, b = instruction
+    match opcode:
+        case Opcode.SET:
+            return a
+        case Opcode.COPY:
+            return values[a]
+        case Opcode.NOT:
+            return ~values[a] & MASK
+        case Opcode.OR:
+            return values[a] | values[b]
+        case Opcode.AND:
+            return values[a] & values[b]
+        case Opcode.AND_CONSTANT:
+            return a & values[b]
+        case Opcode.LSHIFT:
+            return values[a] << b & MASK
+        case Opcode.RSHIFT:
+            return values[a] >> b
+
+
+def compile_circuit(circuit: Circuit) -> Program:
+    """Topologically sort the circuit's wires into a ``Program``.
+
+    Kahn's algorithm over the ``outputs`` fan-out of each wire: a wire is
+    ready once every input of the gate driving it has been emitted.
+    """
+    wires = circuit.wires.values()
+    driven = {wire.input: wire for wire in wires}
+    waiting = {wire: wire.input.INPUTS for wire in wires}
+    ready = deque(wire for wire, count in waiting.items() if not count)
+    registers: dict[Wire, int] = {}
+    code: list[Instruction] = []
+    while ready:
+        wire = ready.popleft()
+        code.append(wire.input.compile(registers))
+        registers[wire] = len(registers)
+        for component in wire.outputs:
+            output = driven[component]
+            waiting[output] -= 1
+            if not waiting[output]:
+                ready.append(output)
+    if len(registers) < len(waiting):
+        raise RuntimeError('circuit has a loop or an undriven wire')
+    return Program(
+        list(registers),
+        {wire.name: register for wire, register in registers.items()},
+        code,
+    )
+
+
+@final
+class Simulation:
+    """Settled values of a program's wires that follow overrides.
+
+    Driving a wire with a constant recomputes only the gates downstream of
+    it, found through the ``outputs`` fan-out of each wire, and stops along
+    any path where a value comes out the same as before. Registers are in
+    dependency order, so taking dirty ones lowest first computes each gate
+    at most once, after all of its changed inputs.
+    """
+
+    __slots__ = ('_code', '_readers', 'program', 'values')
+
+    def __init__(self, program: Program) -> None:
+        registers = {wire: i for i, wire in enumerate(program.wires)}
+        driven = {wire.input: registers[wire] for wire in program.wires}
+        self.program: Final = program
+        self.values: Final = program.run()
+        self._code: Final = list(program.code)
+        self._readers: Final = [
+            sorted({driven[component] for component in wire.outputs})
+            for wire in program.wires
+        ]
+
+    def get_value(self, name: str) -> int:
+        return self.values[self.program.registers[name]]
+
+    def set_value(self, name: str, value: int) -> int:
+        """Drive wire ``name`` with ``value``; how many wires changed."""
+        register = self.program.registers[name]
+        self._code[register] = Instruction(Opcode.SET, value & MASK)
+        return self._settle(register)
+
+    def release(self, name: str) -> int:
+        """Drive wire ``name`` by its own gate again; how many changed."""
+        register = self.program.registers[name]
+        self._code[register] = self.program.code[register]
+        return self._settle(register)
+
+    def _settle(self, register: int) -> int:
+        code = self._code
+        values = self.values
+        readers = self._readers
+        dirty = [register]
+        queued = {register}
+        changed = 0
+        while dirty:
+            register = heappop(dirty)
+            value = execute(code[register], values)
+            if value == values[register]:
+                continue
+            values[register] = value
+            changed += 1
+            for reader in readers[register]:
+                if reader not in queued:
+                    queued.add(reader)
+                    heappush(dirty, reader)
+        return changed
+
+
+def evaluate(circuit: Circuit) -> Program:
+    """Settle every wire of ``circuit`` in one pass of its program."""
+    program = compile_circuit(circuit)
+    for wire, value in zip(program.wires, program.run()):
+        wire.set_value(value)
+    return program
+
+
 def part_1(circuit: Circuit) -> int:
+    evaluate(circuit)
     result = circuit.wires['a'].get_value()
     for node in circuit.nodes:
         print(node)
@@ -274,11 +556,9 @@ def part_1(circuit: Circuit) -> int:
 
 
 def part_2(circuit: Circuit) -> int:
-    wire_a = circuit.wires['a']
-    value_b = wire_a.get_value()
-    circuit.reset()
-    circuit.wires['b'].set_value(value_b)
-    return wire_a.get_value()
+    simulation = Simulation(compile_circuit(circuit))
+    simulation.set_value('b', simulation.get_value('a'))
+    return simulation.get_value('a')
 
 
 def main() -> None:
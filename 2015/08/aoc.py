@@ -1,9 +1,16 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser
 from dataclasses import dataclass
-from enum import Enum, auto, unique
 from pathlib import Path
-from typing import Literal, final
+import re
+import sys
+from typing import Final, Literal, NamedTuple, final
+
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from stream import line_blocks
+
+HEX_ESCAPE: Final = re.compile(rb'\\+x[0-9a-f]{2}')
 
 
 @final
@@ -21,102 +28,55 @@ def parse_args() -> Arguments:
     return Arguments(part=args.part, input_path=args.input)
 
 
-def load_text(path: Path) -> str:
-    return path.read_text()
+@final
+class Lengths(NamedTuple):
+    code: int
+    decoded: int
+    encoded: int
 
 
-@final
-@unique
-class State(Enum):
-    START = auto()
-    SLASH_1 = auto()
-    HEX_1 = auto()
-    HEX_2 = auto()
-
-
-def part_1(text: str) -> int:
-    state = State.START
-    code_len = 0
-    data_len = 0
-    for c in text:
-        if c == '\n':
-            continue
-        code_len += 1
-        match c:
-            case '\\':
-                match state:
-                    case State.START:
-                        state = State.SLASH_1
-                    case State.SLASH_1:
-                        state = State.START
-                        data_len += 1
-                    case _:
-                        raise ValueError()
-            case '"':
-                match state:
-                    case State.START:
-                        pass
-                    case State.SLASH_1:
-                        state = State.START
-                        data_len += 1
-                    case _:
-                        raise ValueError()
-            case 'x':
-                match state:
-                    case State.START:
-                        data_len += 1
-                    case State.SLASH_1:
-                        state = State.HEX_1
-                    case _:
-                        raise ValueError()
-            case _:
-                match state:
-                    case State.START:
-                        data_len += 1
-                    case State.HEX_1:
-                        state = State.HEX_2
-                    case State.HEX_2:
-                        data_len += 1
-                        state = State.START
-                    case _:
-                        raise ValueError()
-    return code_len - data_len
-
-
-def part_2(text: str) -> int:
-    state = State.START
-    code_len = 0
-    encode_len = 0
-    for c in text:
-        if c == '\n':
-            continue
-        code_len += 1
-        match c:
-            case '\\':
-                match state:
-                    case State.START:
-                        state = State.SLASH_1
-                        encode_len += 2
-                    case State.SLASH_1:
-                        state = State.START
-                        encode_len += 2
-            case '"':
-                match state:
-                    case State.START:
-                        encode_len += 3
-                    case State.SLASH_1:
-                        state = State.START
-                        encode_len += 2
-            case 'x':
-                match state:
-                    case State.START:
-                        encode_len += 1
-                    case State.SLASH_1:
-                        state = State.START
-                        encode_len += 1
-            case _:
-                encode_len += 1
-    return encode_len - code_len
+def measure(block: bytes) -> Lengths:
+    """Lengths of the literals in ``block`` as code, as data and re-encoded.
+
+    Everything follows from a few counts. A run of backslashes can only
+    start an escape, so ``count`` pairs it up from the left just as the
+    literal does, and any odd backslash left over escapes a quote or an
+    ``x``; the regex finds runs ending in ``x`` and two hex digits. The
+    quotes that are not escaped are the two around each literal.
+    """
+    quotes = block.count(b'"')
+    backslashes = block.count(b'\\')
+    pairs = block.count(b'\\\\')
+    # Only an odd run of backslashes leaves one to escape the x, and an odd
+    # run plus the x and two digits is an even length.
+    hexes = sum(len(match) % 2 == 0 for match in HEX_ESCAPE.findall(block))
+    singles = backslashes - 2 * pairs
+    literals = (quotes - (singles - hexes)) // 2
+    code = len(block) - block.count(b'\n') - block.count(b'\r')
+    return Lengths(
+        code=code,
+        decoded=code - 2 * literals - pairs - singles - 2 * hexes,
+        encoded=code + 2 * literals + quotes + backslashes,
+    )
+
+
+def load_lengths(path: Path) -> Lengths:
+    # Blocks end on line breaks, so no literal or escape is split.
+    code = decoded = encoded = 0
+    for lengths in map(measure, line_blocks(path)):
+        code += lengths.code
+        decoded += lengths.decoded
+        encoded += lengths.encoded
+    return Lengths(code=code, decoded=decoded, encoded=encoded)
+
+
+def part_1(lengths: Lengths) -> int:
+    return lengths.code - lengths.decoded
+
+
+def part_2(lengths: Lengths) -> int:
+    return lengths.encoded - lengths.code
+
 
 def main() -> None:
     args = parse_args()
@@ -125,7 +85,7 @@ def main() -> None:
             part = part_1
         case 2:
             part = part_2
-    print(part(load_text(args.input_path)))
+    print(part(load_lengths(args.input_path)))
 
 
 if __name__ == '__main__':
@@ -1,9 +1,19 @@
 #!/usr/bin/env python
 from argparse import ArgumentParser
 from dataclasses import dataclass
-from itertools import permutations
 from pathlib import Path
-from typing import Final, Literal, final
+import sys
+from typing import TYPE_CHECKING, Final, Literal, NamedTuple, final
+
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from lazy import lazy_import
+
+if TYPE_CHECKING:
+    from numpy import bool_, int64
+    from numpy.typing import NDArray
+
+numpy: Final = lazy_import('numpy')
 
 
 @final
@@ -53,15 +63,105 @@ def load_graph(path: Path) -> dict[str, Node]:
     return nodes
 
 
-def part_1(graph: dict[str, Node]) -> int:
-    return min(
-        sum(path[i - 1].distances[node] for i, node in enumerate(path[1:]))
-        for path in permutations(graph.values())
+@final
+class Routes(NamedTuple):
+    shortest: int
+    longest: int
+
+
+def road_matrix(
+    graph: dict[str, Node],
+) -> tuple['NDArray[int64]', 'NDArray[bool_]']:
+    """Distances between locations by index, and which pairs have a road."""
+    nodes = list(graph.values())
+    index = {node: i for i, node in enumerate(nodes)}
+    distances = numpy.zeros((len(nodes), len(nodes)), dtype=numpy.int64)
+    roads = numpy.zeros((len(nodes), len(nodes)), dtype=bool)
+    for i, node in enumerate(nodes):
+        for other, distance in node.distances.items():
+            distances[i, index[other]] = distance
+            roads[i, index[other]] = True
+    return distances, roads
+
+
+def find_routes(distances: 'NDArray[int64]', roads: 'NDArray[bool_]') -> Routes:
+    """Held-Karp over a distance matrix: both extremes through every index.
+
+    ``reached[visited, last]`` says some path through the set of locations
+    ``visited`` ends at ``last``, and ``shortest`` and ``longest`` hold the
+    extremes of those paths. Sets are filled in order of size, and for each
+    size and last location all such sets at once, so the O(2^n n^2) work is
+    done in O(n^2) NumPy steps, once for both parts.
+
+    Only the layer of sets being filled and the one before it are kept,
+    each indexed by a set's rank among the sets of its size, so memory
+    follows the widest layer rather than all 2^n sets. Lengths are int32
+    whenever a route through every location is sure to fit.
+    """
+    count = len(distances)
+    if not count:
+        raise ValueError('no locations')
+    full = 1 << count
+    dtype = (
+        numpy.int32
+        if count * int(distances.max()) <= numpy.iinfo(numpy.int32).max
+        else numpy.int64
     )
+    distances = distances.astype(dtype)
+    bounds = numpy.iinfo(dtype)
+    locations = numpy.arange(count)
+    sets = numpy.arange(full)
+    sizes = numpy.zeros(full, dtype=numpy.int8)
+    for location in range(count):
+        sizes += (sets >> location) & 1
+    rank = numpy.zeros(full, dtype=numpy.int32)
+    layer = 1 << locations
+    rank[layer] = locations
+    reached = numpy.zeros((count, count), dtype=bool)
+    reached[locations, locations] = True
+    shortest = numpy.zeros((count, count), dtype=dtype)
+    longest = numpy.zeros((count, count), dtype=dtype)
+    for size in range(2, count + 1):
+        layer = sets[sizes == size]
+        rank[layer] = numpy.arange(len(layer))
+        next_reached = numpy.zeros((len(layer), count), dtype=bool)
+        next_shortest = numpy.zeros((len(layer), count), dtype=dtype)
+        next_longest = numpy.zeros((len(layer), count), dtype=dtype)
+        for last in range(count):
+            visited = numpy.flatnonzero((layer >> last) & 1)
+            before = rank[layer[visited] ^ (1 << last)]
+            steps = reached[before] & roads[:, last]
+            reach = steps.any(axis=1)
+            next_reached[visited, last] = reach
+            # Steps that do not exist are masked with the bounds, which only
+            # ever lose a comparison and are never added to; sets that cannot
+            # end at ``last`` are zeroed.
+            lengths = shortest[before] + distances[:, last]
+            lengths = numpy.where(steps, lengths, bounds.max).min(axis=1)
+            next_shortest[visited, last] = numpy.where(reach, lengths, 0)
+            lengths = longest[before] + distances[:, last]
+            lengths = numpy.where(steps, lengths, bounds.min).max(axis=1)
+            next_longest[visited, last] = numpy.where(reach, lengths, 0)
+        reached, shortest, longest = next_reached, next_shortest, next_longest
+    [ends] = reached
+    if not ends.any():
+        raise ValueError('no route visits every location')
+    return Routes(
+        shortest=int(shortest[0][ends].min()),
+        longest=int(longest[0][ends].max()),
+    )
+
+
+def load_routes(path: Path) -> Routes:
+    return find_routes(*road_matrix(load_graph(path)))
+
+
+def part_1(routes: Routes) -> int:
+    return routes.shortest
 
 
-def part_2(graph: object) -> int:
-    return 0
+def part_2(routes: Routes) -> int:
+    return routes.longest
 
 
 def main() -> None:
@@ -71,7 +171,7 @@ def main() -> None:
             part = part_1
         case 2:
             part = part_2
-    print(part(load_graph(args.input_path)))
+    print(part(load_routes(args.input_path)))
 
 
 if __name__ == '__main__':
@@ -2,7 +2,11 @@
 from argparse import ArgumentParser
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Literal, final
+from pathlib import Path
+from typing import Final, Literal, final
+
+
+PUZZLE: Final = '3113322113'
 
 
 @final
@@ -19,11 +23,18 @@ def parse_input(text: str) -> list[int]:
 def parse_args() -> Arguments:
     parser = ArgumentParser()
     parser.add_argument('part', type=int, choices=(1, 2))
-    parser.add_argument('-i', '--input', default='3113322113', type=parse_input)
+    parser.add_argument('-i', '--input', default=PUZZLE, type=parse_input)
     args = parser.parse_args()
     return Arguments(part=args.part, input=args.input)
 
 
+def default_arguments(input_path: Path, part: Literal[1, 2]) -> Arguments:
+    # The command line takes the puzzle itself; a runner with a file of it,
+    # such as one from generate.py, hands over the file.
+    puzzle = input_path.read_text().strip() if input_path.exists() else PUZZLE
+    return Arguments(part=part, input=parse_input(puzzle))
+
+
 def step(input: Iterable[int]) -> list[int]:
     it = iter(input)
     count = 1
@@ -2,6 +2,7 @@
 from argparse import ArgumentParser
 from collections import defaultdict
 from dataclasses import dataclass
+from pathlib import Path
 from typing import ClassVar, Final, Literal, final, override
 
 
@@ -26,6 +27,9 @@ class Password:
         raise OverflowError()
 
 
+PASSWORD: Final = 'vzbxkghb'
+
+
 @final
 @dataclass(frozen=True, kw_only=True, slots=True)
 class Arguments:
@@ -36,11 +40,19 @@ class Arguments:
 def parse_args() -> Arguments:
     parser = ArgumentParser()
     parser.add_argument('part', type=int, choices=(1, 2))
-    parser.add_argument('-p', '--password', default='vzbxkghb', type=Password)
+    parser.add_argument('-p', '--password', default=PASSWORD, type=Password)
     args = parser.parse_args()
     return Arguments(part=args.part, password=args.password)
 
 
+def default_arguments(input_path: Path, part: Literal[1, 2]) -> Arguments:
+    # As in 2015/10, a file of the password stands in for --password.
+    password = (
+        input_path.read_text().strip() if input_path.exists() else PASSWORD
+    )
+    return Arguments(part=part, password=Password(password))
+
+
 def validate(pwd: Password) -> bool:
     prev_1 = prev_2 = -1
     rule_1 = False
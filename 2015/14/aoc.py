@@ -2,7 +2,10 @@
 from argparse import ArgumentParser
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal, final
+from typing import Final, Literal, final
+
+
+DURATION: Final = 2503
 
 
 @final
@@ -17,7 +20,7 @@ def parse_args() -> Arguments:
     parser = ArgumentParser()
     parser.add_argument('part', type=int, choices=(1, 2))
     parser.add_argument('input', type=Path)
-    parser.add_argument('-d', '--duration', default=2503, type=int)
+    parser.add_argument('-d', '--duration', default=DURATION, type=int)
     args = parser.parse_args()
     return Arguments(
         part=args.part,
@@ -26,6 +29,10 @@ def parse_args() -> Arguments:
     )
 
 
+def default_arguments(input_path: Path, part: Literal[1, 2]) -> Arguments:
+    return Arguments(part=part, input_path=input_path, duration=DURATION)
+
+
 @final
 @dataclass(frozen=True, kw_only=True, slots=True)
 class Reindeer:
@@ -2,10 +2,17 @@
 from argparse import ArgumentParser
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+import sys
+from typing import Final, Literal
+
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from grid import Grid, table
 
 verbose = False
 
+STEPS: Final = 100
+
 
 @dataclass(frozen=True, kw_only=True, slots=True)
 class Arguments:
@@ -17,7 +24,7 @@ class Arguments:
 
 def parse_args() -> Arguments:
     parser = ArgumentParser()
-    parser.add_argument('-s', '--steps', default=100, type=int)
+    parser.add_argument('-s', '--steps', default=STEPS, type=int)
     parser.add_argument('-v', '--verbose', action='store_true')
     parser.add_argument('part', default=1, choices=(1, 2), type=int)
     parser.add_argument('input', nargs='?', type=Path)
@@ -34,86 +41,87 @@ def parse_args() -> Arguments:
     )
 
 
-type Lights = tuple[list[bool], ...]
+def default_arguments(input_path: Path, part: Literal[1, 2]) -> Arguments:
+    return Arguments(
+        part=part, input_path=input_path, steps=STEPS, verbose=False
+    )
 
 
-def print_lights(lights: Lights) -> None:
-    for row in lights:
-        for light in row:
-            print('#' if light else '.', end='')
-        print()
+type Lights = Grid
 
+OFF: Final = 0
 
-def load_lights(path: Path) -> Lights:
-    with open(path) as file:
-        return tuple([token == '#' for token in line.rstrip()] for line in file)
+ON: Final = 1
 
+LIGHT_CODES: Final = table({b'#': ON})
 
-def copy_lights(lights: Lights) -> Lights:
-    return tuple([light for light in row] for row in lights)
+# A cell's neighbour count plus nine times its own state, mapped to its next
+# state: on with two or three neighbours on, off with exactly three.
+NEXT_STATE: Final = bytes(
+    ON if total in (3, 9 + 2, 9 + 3) else OFF for total in range(256)
+)
+
+
+def print_lights(lights: Lights) -> None:
+    for y in range(1, lights.height - 1):
+        row = lights.row(y)[1:-1]
+        print(''.join('#' if light else '.' for light in row))
+
+
+def load_lights(path: Path) -> Lights:
+    # The border of off lights lets every interior cell read all eight
+    # neighbours without bounds checks.
+    return Grid.load(path).translate(LIGHT_CODES).padded(OFF)
 
 
 type Result = int
 
 
-def is_neighbor_on(
-    lights: Lights,
-    x: int,
-    y: int,
-    dx: int = 0,
-    dy: int = 0,
-) -> bool:
-    y += dy
-
-    if y < 0 or y >= len(lights):
-        return False
-
-    x += dx
-    row = lights[y]
-
-    return 0 <= x < len(row) and row[x]
-
-
-def count_neighors_on(lights: Lights, x: int, y: int) -> int:
-    return sum(
-        is_neighbor_on(lights, x, y, dx, dy)
-        for dx, dy in (
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-            (0, -1),
-            (0, 1),
-            (1, -1),
-            (1, 0),
-            (1, 1),
-        )
-    )
+def step(lights: Lights) -> None:
+    # Each light is one byte of a single big integer, so shifting the whole
+    # grid by a neighbour offset lines every cell up with that neighbour at
+    # once. Totals stay below 18, so bytes never carry into each other.
+    cells = lights.cells
+    size = len(cells)
+    mask = (1 << (8 * size)) - 1
+    state = int.from_bytes(cells, 'little')
+    total = 9 * state
+    for offset in lights.offsets_8:
+        if offset > 0:
+            total += state >> (8 * offset)
+        else:
+            total += (state << (-8 * offset)) & mask
+    cells[:] = total.to_bytes(size, 'little').translate(NEXT_STATE)
+    width = lights.width
+    border = bytes(width)
+    cells[:width] = border
+    cells[-width:] = border
+    edge = bytes(lights.height)
+    cells[::width] = edge
+    cells[width - 1 :: width] = edge
+
+
+def turn_corners_on(lights: Lights) -> None:
+    right = lights.width - 2
+    bottom = lights.height - 2
+    for x, y in ((1, 1), (right, 1), (1, bottom), (right, bottom)):
+        lights.set(x, y, ON)
 
 
 def run(lights: Lights, steps: int, corners_on: bool = False) -> Result:
-    a = lights
-    b = copy_lights(lights)
-    del lights
     if corners_on:
-        a[0][0] = a[0][-1] = a[-1][0] = a[-1][-1] = True
+        turn_corners_on(lights)
     if verbose:
-        print_lights(a)
+        print_lights(lights)
     for i in range(steps):
-        for y, row in enumerate(a):
-            for x, light in enumerate(row):
-                neighors_on = count_neighors_on(a, x, y)
-                if light:
-                    b[y][x] = neighors_on == 2 or neighors_on == 3
-                else:
-                    b[y][x] = neighors_on == 3
-        a, b = b, a
+        step(lights)
         if corners_on:
-            a[0][0] = a[0][-1] = a[-1][0] = a[-1][-1] = True
+            turn_corners_on(lights)
         if verbose:
             print()
             print('Step', i + 1)
-            print_lights(a)
-    return sum(light for row in a for light in row)
+            print_lights(lights)
+    return lights.count(ON)
 
 
 def part_1(lights: Lights, steps: int) -> Result:
@@ -3,8 +3,13 @@ from argparse import ArgumentParser
 from dataclasses import dataclass
 from itertools import cycle
 from pathlib import Path
+import sys
 from typing import Literal
 
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from stream import file_integers
+
 
 @dataclass(frozen=True, kw_only=True, slots=True)
 class Arguments:
@@ -30,8 +35,7 @@ type Result = int
 
 
 def load_input(path: Path) -> Changes:
-    with open(path) as file:
-        return tuple(int(line) for line in file)
+    return tuple(file_integers(path))
 
 
 def part_1(changes: Changes) -> Result:
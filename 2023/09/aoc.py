@@ -23,6 +23,10 @@ def parse_args() -> Arguments:
     return Arguments(part=part, report_path=report_path)
 
 
+def default_arguments(input_path: Path, part: Literal[1, 2]) -> Arguments:
+    return Arguments(part=part, report_path=input_path)
+
+
 def load_report(path: Path) -> list[list[int]]:
     with open(path) as file:
         return [[int(value) for value in line.split(' ')] for line in file]
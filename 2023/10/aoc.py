@@ -2,7 +2,14 @@
 from argparse import ArgumentParser
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal, NamedTuple, final
+import sys
+from typing import Final, Literal, NamedTuple, final
+
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from lazy import lazy_import
+
+networkx: Final = lazy_import('networkx')
 
 
 @final
@@ -31,11 +38,9 @@ class Edge(NamedTuple):
     a: Tile
     b: Tile
 
-from networkx import Graph, all_pairs_dijkstra_path_length, all_shortest_paths, single_source_dijkstra
-
 
 def load_input(path: Path):
-    graph: Graph[Tile] = Graph()
+    graph = networkx.Graph()
     x = -1
     y = -1
 
@@ -76,7 +81,7 @@ def load_input(path: Path):
         raise ValueError('start not found')
 
 
-    lengths = single_source_dijkstra(graph, start)[0]
+    lengths = networkx.single_source_dijkstra(graph, start)[0]
     result = max(lengths, key=lambda t: lengths[t])
     print(lengths[result])
 
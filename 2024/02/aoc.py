@@ -3,8 +3,13 @@ from argparse import ArgumentParser
 from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
+import sys
 from typing import Literal
 
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from stream import integers, lines
+
 
 @dataclass(frozen=True, kw_only=True, slots=True)
 class Arguments:
@@ -30,10 +35,7 @@ type Result = int
 
 
 def load_input(path: Path) -> Input:
-    with open(path) as file:
-        return tuple(
-            tuple(int(token) for token in line.strip().split()) for line in file
-        )
+    return tuple(tuple(integers(line)) for line in lines(path))
 
 
 def is_safe_increase(from_level: int, to_level: int) -> bool:
@@ -3,7 +3,12 @@ from argparse import ArgumentParser
 from dataclasses import dataclass
 from pathlib import Path
 import re
-from typing import Literal
+import sys
+from typing import Final, Literal, NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from stream import mapped
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -24,43 +29,53 @@ def parse_args() -> Arguments:
     return Arguments(part=args.part, input_path=input_path)
 
 
-type Input = str
+class Multiplication(NamedTuple):
+    a: int
+    b: int
+    enabled: bool
+
+
+type Input = tuple[Multiplication, ...]
 
 type Result = int
 
 
+instruction_pattern: Final = re.compile(
+    rb"""
+          (do) \(\)
+        | (don't) \(\)
+        | (mul) \( ([0-9]{1,3}) , ([0-9]{1,3}) \)
+    """,
+    flags=re.VERBOSE,
+)
+
+
 def load_input(path: Path) -> Input:
-    return path.read_text()
+    """Every ``mul``, with whether ``do()`` and ``don't()`` left it enabled.
+
+    The map is scanned once and closed again, so what comes back is plain
+    data the cache can keep.
+    """
+    multiplications: list[Multiplication] = []
+    enabled = True
+    with mapped(path) as buffer:
+        for match in instruction_pattern.finditer(buffer):
+            do, dont, mul, a, b = match.groups()
+            if do:
+                enabled = True
+            elif dont:
+                enabled = False
+            elif mul:
+                multiplications.append(Multiplication(int(a), int(b), enabled))
+    return tuple(multiplications)
 
 
 def part_1(input: Input) -> Result:
-    return sum(
-        int(a) * int(b)
-        for a, b in (
-            match.groups()
-            for match in re.finditer(r'mul\((\d{1,3}),(\d{1,3})\)', input)
-        )
-    )
+    return sum(a * b for a, b, _ in input)
 
 
 def part_2(input: Input) -> Result:
-    pattern = re.compile(r'''
-          (do) \(\)
-        | (don't) \(\)
-        | (mul) \( ([0-9]{1,3}) , ([0-9]{1,3}) \)
-    ''', flags=re.VERBOSE)
-
-    result = 0
-    enabled = True
-    for match in pattern.finditer(input):
-        do, dont, mul, a, b = match.groups()
-        if do:
-            enabled = True
-        elif dont:
-            enabled = False
-        elif mul and enabled:
-            result += int(a) * int(b)
-    return result
+    return sum(a * b for a, b, enabled in input if enabled)
 
 
 def main() -> None:
@@ -3,8 +3,13 @@ from argparse import ArgumentParser
 from dataclasses import dataclass
 from itertools import count
 from pathlib import Path
+import sys
 from typing import Iterable, Literal, final
 
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from stream import digits
+
 
 @dataclass(frozen=True, kw_only=True, slots=True)
 class Arguments:
@@ -31,7 +36,7 @@ def part_1(path: Path) -> Result:
     is_file = True
     file_id = 0
     disk: list[int] = []
-    for token in map(int, path.read_text().rstrip()):
+    for token in digits(path):
         if is_file:
             sector = file_id
             file_id += 1
@@ -87,7 +92,7 @@ def part_2(path: Path) -> Result:
     frees: list[Span] = []
     start = 0
     is_file = True
-    for length in map(int, path.read_text().rstrip()):
+    for length in digits(path):
         span = Span(
             start=start,
             length=length,
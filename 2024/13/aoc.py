@@ -3,8 +3,13 @@ from argparse import ArgumentParser
 from dataclasses import dataclass
 from pathlib import Path
 import re
+import sys
 from typing import Final, Literal, NamedTuple, final, override
 
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from stream import mapped
+
 
 @dataclass(frozen=True, kw_only=True, slots=True)
 class Arguments:
@@ -49,7 +54,7 @@ type Machines = tuple[Machine, ...]
 
 
 machine_pattern: Final = re.compile(
-    r"""
+    rb"""
         Button[ ]A:[ ]X\+([1-9][0-9]*),[ ]Y\+([1-9][0-9]*)\n
         Button[ ]B:[ ]X\+([1-9][0-9]*),[ ]Y\+([1-9][0-9]*)\n
         Prize:[ ]X=([1-9][0-9]*),[ ]Y=([1-9][0-9]*)\n+
@@ -60,9 +65,12 @@ machine_pattern: Final = re.compile(
 
 def load_machines(path: Path) -> Machines:
     machines: list[Machine] = []
-    for match in machine_pattern.finditer(path.read_text()):
-        ax, ay, bx, by, px, py = map(int, match.groups())
-        machines.append(Machine(Point(ax, ay), Point(bx, by), Point(px, py)))
+    with mapped(path) as buffer:
+        for match in machine_pattern.finditer(buffer):
+            ax, ay, bx, by, px, py = map(int, match.groups())
+            machines.append(
+                Machine(Point(ax, ay), Point(bx, by), Point(px, py))
+            )
     return tuple(machines)
 
 
@@ -4,7 +4,14 @@ from collections import defaultdict
 from dataclasses import dataclass
 from itertools import count
 from pathlib import Path
-from typing import Literal, NamedTuple, final, override
+from typing import Final, Literal, NamedTuple, final, override
+
+
+WIDTH: Final = 101
+
+HEIGHT: Final = 103
+
+STEPS: Final = 100
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -18,9 +25,9 @@ class Arguments:
 
 def parse_args() -> Arguments:
     parser = ArgumentParser()
-    parser.add_argument('-w', '--width', default=101, type=int)
-    parser.add_argument('-H', '--height', default=103, type=int)
-    parser.add_argument('-s', '--steps', default=100, type=int)
+    parser.add_argument('-w', '--width', default=WIDTH, type=int)
+    parser.add_argument('-H', '--height', default=HEIGHT, type=int)
+    parser.add_argument('-s', '--steps', default=STEPS, type=int)
     parser.add_argument('part', choices=(1, 2), type=int)
     parser.add_argument('input', nargs='?', type=Path)
     args = parser.parse_args()
@@ -37,6 +44,16 @@ def parse_args() -> Arguments:
     )
 
 
+def default_arguments(input_path: Path, part: Literal[1, 2]) -> Arguments:
+    return Arguments(
+        part=part,
+        input_path=input_path,
+        width=WIDTH,
+        height=HEIGHT,
+        steps=STEPS,
+    )
+
+
 @final
 class Vector(NamedTuple):
     x: int
@@ -1,11 +1,14 @@
 #!/usr/bin/python
 from argparse import ArgumentParser
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum, auto, unique
-import heapq
-from math import inf
 from pathlib import Path
-from typing import ClassVar, Final, Literal, final, override
+import sys
+from typing import ClassVar, Final, Literal, NamedTuple, final, override
+
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from search import dijkstra
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -83,12 +86,9 @@ class Direction(Enum):
 
 
 @final
-class Leave:
-    __slots__: ClassVar = ('tile', 'cost')
-
-    def __init__(self, tile: 'Tile', cost: int) -> None:
-        self.tile: Final = tile
-        self.cost: Final = cost
+class Leave(NamedTuple):
+    tile: 'Tile'
+    cost: int
 
 
 class Tile:
@@ -109,6 +109,10 @@ class Tile:
                 )
         return '\n'.join(lines)
 
+    @override
+    def __reduce__(self) -> tuple[object, ...]:
+        return type(self), (self.x, self.y)
+
 
 @final
 class StartTile(Tile):
@@ -154,6 +158,34 @@ class Input:
     def print_grid(self) -> None:
         print_grid(self.grid)
 
+    @override
+    def __reduce__(self) -> tuple[object, ...]:
+        # Tiles pickle without their exits, which are pickled alongside them
+        # here instead, so the pickler never follows a path tile by tile.
+        return relink_input, (
+            self.grid,
+            self.start,
+            self.end,
+            [
+                tile.enter
+                for row in self.grid
+                for tile in row
+                if tile is not None
+            ],
+        )
+
+
+def relink_input(
+    grid: Grid,
+    start: StartTile,
+    end: EndTile,
+    enters: list[dict[Direction, dict[Direction, Leave]]],
+) -> Input:
+    tiles = (tile for row in grid for tile in row if tile is not None)
+    for tile, enter in zip(tiles, enters, strict=True):
+        tile.enter.update(enter)
+    return Input(grid, start, end)
+
 
 def link_tiles(
     tile: Tile,
@@ -253,52 +285,25 @@ def load_input(path: Path) -> Input:
     return Input(grid, start, end)
 
 
-@final
-@dataclass(order=True)
-class HeapItem:
-    tile: Final[Tile] = field(compare=False)
-    facing: Final[Direction] = field(compare=False)
-    cost: Final[float] = inf
-    is_dead: bool = field(default=False, compare=False)
-
-
 def compute_costs(input: Input) -> dict[tuple[Tile, Direction], float]:
-    heap: list[HeapItem] = []
-    items: dict[tuple[Tile, Direction], HeapItem] = {}
-
+    states: dict[tuple[Tile, Direction], int] = {}
     for row in input.grid:
         for tile in row:
             if tile is not None:
                 for facing in tile.enter:
-                    item = HeapItem(tile, facing)
-                    heapq.heappush(heap, item)
-                    items[(tile, facing)] = item
-
-    def pop() -> HeapItem | None:
-        while heap:
-            item = heapq.heappop(heap)
-            if not item.is_dead:
-                return item
-
-    def update(tile: Tile, facing: Direction, cost: float) -> None:
-        key = (tile, facing)
-        items[key].is_dead = True
-        item = HeapItem(tile, facing, cost=cost)
-        heapq.heappush(heap, item)
-        items[key] = item
-
-    update(input.start, Direction.RIGHT, 0)
-
-    for item in iter(pop, None):
-        tile = item.tile
-        facing = item.facing
-        cost = item.cost
-        for direction, leave in tile.enter[facing].items():
-            next_cost = cost + leave.cost
-            if next_cost < items[(leave.tile, direction)].cost:
-                update(leave.tile, direction, next_cost)
-
-    return {tf: i.cost for tf, i in items.items()}
+                    states[(tile, facing)] = len(states)
+    edges: list[list[tuple[int, int]]] = [[] for _ in states]
+    for (tile, facing), state in states.items():
+        edges[state] = [
+            (states[(leave.tile, direction)], leave.cost)
+            for direction, leave in tile.enter[facing].items()
+        ]
+    costs = dijkstra(
+        len(states),
+        (states[(input.start, Direction.RIGHT)],),
+        edges.__getitem__,
+    )
+    return {key: costs[state] for key, state in states.items()}
 
 
 def part_1(input: Input) -> int:
@@ -177,26 +177,31 @@ def part_1(machine: Machine) -> str:
     return ','.join(map(str, machine.output))
 
 
-def find_a(m: Machine, i: int, a_lsb: int) -> int | None:
-    if i == len(m.program):
-        return a_lsb
-    for a_msb in range(8):
-        a = (a_msb << (8 + 3 * i)) | a_lsb
+def find_a(m: Machine, i: int, a_msb: int) -> int | None:
+    """Lowest A whose top digits are ``a_msb`` that prints ``program[i:]``.
+
+    Each pass prints a digit and drops the lowest three bits of A, so A is
+    built from its top digit down. Trying each digit in order finds the
+    lowest A first.
+    """
+    if i < 0:
+        return a_msb
+    for digit in range(8):
+        if not (a := a_msb << 3 | digit):
+            continue
         m.reset_and_run(a)
-        if m.output[: i + 1] == m.program[: i + 1]:
-            if (a := find_a(m, i + 1, a)) is not None:
-                return a
+        if (
+            m.output == m.program[i:]
+            and (found := find_a(m, i - 1, a)) is not None
+        ):
+            return found
+    return None
 
 
 def part_2(machine: Machine) -> int:
-    for a_lsb in range(2**12):
-        machine.reset_and_run(a_lsb)
-        if (
-            machine.output[0] == machine.program[0]
-            and (a := find_a(machine, 1, a_lsb)) is not None
-        ):
-            return a
-    raise ValueError()
+    if (a := find_a(machine, len(machine.program) - 1, 0)) is None:
+        raise ValueError()
+    return a
 
 
 def main() -> None:
@@ -1,11 +1,22 @@
 #!/usr/bin/python
 from argparse import ArgumentParser
-from dataclasses import dataclass, field
-import heapq
+from bisect import bisect_left
+from dataclasses import dataclass
 from pathlib import Path
+import sys
 from typing import Final, Literal, final
 
-from rich import print
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from grid import Grid
+from lazy import lazy_import
+from search import UNREACHED, bfs
+
+rich: Final = lazy_import('rich')
+
+COUNT: Final = 1024
+
+SIZE: Final = 70
 
 
 @final
@@ -19,8 +30,8 @@ class Arguments:
 
 def parse_args() -> Arguments:
     parser = ArgumentParser()
-    parser.add_argument('-c', '--count', default=1024, type=int)
-    parser.add_argument('-s', '--size', default=70, type=int)
+    parser.add_argument('-c', '--count', default=COUNT, type=int)
+    parser.add_argument('-s', '--size', default=SIZE, type=int)
     parser.add_argument('part', default=1, choices=(1, 2), type=int)
     parser.add_argument('input', nargs='?', type=Path)
     args = parser.parse_args()
@@ -36,6 +47,10 @@ def parse_args() -> Arguments:
     )
 
 
+def default_arguments(input_path: Path, part: Literal[1, 2]) -> Arguments:
+    return Arguments(part=part, input_path=input_path, count=COUNT, size=SIZE)
+
+
 type Input = tuple[tuple[int, int], ...]
 
 
@@ -49,73 +64,57 @@ def load_input(path: Path) -> Input:
         return tuple(parse_line(line) for line in file)
 
 
-@final
-@dataclass(order=True, slots=True)
-class Item:
-    x: Final[int] = field(compare=False)
-    y: Final[int] = field(compare=False)
-    distance: int
-    alive: bool = field(default=True, compare=True)
+FREE: Final = 0
+
+CORRUPTED: Final = 1
 
 
 def find_path_length(size: int, obsticals: frozenset[tuple[int, int]]) -> int:
-    heap: list[Item] = []
-    items: dict[tuple[int, int], Item] = {}
-
-    def push(x: int, y: int, distance: int) -> Item:
-        item = Item(x, y, distance)
-        heapq.heappush(heap, item)
-        items[(x, y)] = item
-        return item
-
-    def pop() -> Item | None:
-        while heap:
-            item = heapq.heappop(heap)
-            if item.alive:
-                return item
-
-    def update(x: int, y: int, distance: int) -> None:
-        xy = (x, y)
-        items[xy].alive = False
-        item = Item(x, y, distance)
-        heapq.heappush(heap, item)
-        items[xy] = item
-
-    push(0, 0, 0)
-
-    while (item := pop()) is not None:
-        for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
-            x = item.x + dx
-            if x < 0 or x > size:
-                continue
-            y = item.y + dy
-            if y < 0 or y > size:
-                continue
-            xy = (x, y)
-            if xy in obsticals:
-                continue
-            neighbor = items.get(xy)
-            distance = item.distance + 1
-            if neighbor is None:
-                push(x, y, distance)
-            elif distance < neighbor.distance:
-                update(x, y, distance)
-
-    return items[(size, size)].distance
+    grid = Grid(size + 1, size + 1)
+    for x, y in obsticals:
+        grid.set(x, y, CORRUPTED)
+    grid = grid.padded(CORRUPTED)
+    cells = grid.cells
+    offsets = grid.offsets_4
+
+    def neighbours(state: int) -> list[int]:
+        return [
+            neighbour
+            for offset in offsets
+            if not cells[neighbour := state + offset]
+        ]
+
+    start = grid.pack(1, 1)
+    end = grid.pack(size + 1, size + 1)
+    distance = bfs(len(grid), (start,), neighbours, end)[end]
+    if distance == UNREACHED:
+        raise KeyError((size, size))
+    return int(distance)
 
 
 def part_1(input: Input, count: int, size: int) -> int:
     return find_path_length(size, frozenset(input[:count]))
 
 
+def is_blocked(input: Input, size: int, count: int) -> bool:
+    try:
+        find_path_length(size, frozenset(input[:count]))
+    except KeyError:
+        return True
+    return False
+
+
 def part_2(input: Input, size: int) -> str:
-    for i in range(len(input)):
-        obsticals = frozenset(input[:i])
-        try:
-            find_path_length(size, obsticals)
-        except KeyError:
-            return ','.join(map(str, input[i - 1]))
-    raise ValueError()
+    # Adding bytes only ever removes paths, so the first blocking count can
+    # be bisected rather than tried one by one.
+    count = bisect_left(
+        range(len(input) + 1),
+        True,
+        key=lambda count: is_blocked(input, size, count),
+    )
+    if count > len(input):
+        raise ValueError()
+    return ','.join(map(str, input[count - 1]))
 
 
 def main() -> None:
@@ -126,7 +125,7 @@ def main() -> None:
             result = part_1(input, args.count, args.size)
         case 2:
             result = part_2(input, args.size)
-    print(result)
+    rich.print(result)
 
 
 if __name__ == '__main__':
@@ -6,9 +6,16 @@ from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import Enum, auto, unique
 from pathlib import Path
+import sys
 from typing import Final, Literal, final, override
 
-from rich import print
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from lazy import lazy_import
+
+rich: Final = lazy_import('rich')
+
+MIN_SAVING: Final = 100
 
 
 @final
@@ -21,7 +28,7 @@ class Arguments:
 
 def parse_args() -> Arguments:
     parser = ArgumentParser()
-    parser.add_argument('-m', '--min-saving', default=100, type=int)
+    parser.add_argument('-m', '--min-saving', default=MIN_SAVING, type=int)
     parser.add_argument('part', default=1, choices=(1, 2), type=int)
     parser.add_argument('input', nargs='?', type=Path)
     args = parser.parse_args()
@@ -34,6 +41,10 @@ def parse_args() -> Arguments:
     )
 
 
+def default_arguments(input_path: Path, part: Literal[1, 2]) -> Arguments:
+    return Arguments(part=part, input_path=input_path, min_saving=MIN_SAVING)
+
+
 @final
 @unique
 class Token(Enum):
@@ -238,7 +249,7 @@ def main() -> None:
             part = part_1
         case 2:
             part = part_2
-    print(part(load_course(args.input_path), args.min_saving))
+    rich.print(part(load_course(args.input_path), args.min_saving))
 
 
 if __name__ == '__main__':
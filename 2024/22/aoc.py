@@ -2,8 +2,13 @@
 from argparse import ArgumentParser
 from dataclasses import dataclass
 from pathlib import Path
+import sys
 from typing import Literal, final
 
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from stream import file_integers
+
 
 @final
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -28,8 +33,7 @@ type Input = tuple[int, ...]
 
 
 def load_input(path: Path) -> Input:
-    with open(path) as file:
-        return tuple(int(line) for line in file)
+    return tuple(file_integers(path))
 
 
 type Result = int
@@ -2,9 +2,14 @@
 from argparse import ArgumentParser
 from dataclasses import dataclass, field
 from pathlib import Path
+import sys
 from typing import Final, Literal, final
 
-from rich import print
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from lazy import lazy_import
+
+rich: Final = lazy_import('rich')
 
 
 @final
@@ -87,7 +92,7 @@ def main() -> None:
             part = part_1
         case 2:
             part = part_2
-    print(part(load_computers(args.input_path)))
+    rich.print(part(load_computers(args.input_path)))
 
 
 if __name__ == '__main__':
@@ -3,9 +3,14 @@ from abc import ABC, abstractmethod
 from argparse import ArgumentParser
 from dataclasses import dataclass
 from pathlib import Path
+import sys
 from typing import Final, Literal, final, override
 
-from rich import print
+sys.path.insert(0, str(Path(__file__).resolve(strict=True).parents[2]))
+
+from lazy import lazy_import
+
+rich: Final = lazy_import('rich')
 
 
 @final
@@ -232,7 +237,7 @@ def main() -> None:
             part = part_1
         case 2:
             part = part_2
-    print(part(load_input(args.input_path)))
+    rich.print(part(load_input(args.input_path)))
 
 
 if __name__ == '__main__':
@@ -1,56 +1,747 @@
-#!/usr/bin/python
+#!/usr/bin/env python
 from argparse import ArgumentParser
-from dataclasses import dataclass
+import ast
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager, nullcontext, redirect_stdout
+import copy
+import cProfile
+from dataclasses import dataclass, replace
+from enum import Enum, auto, unique
+from importlib.util import module_from_spec, spec_from_file_location
+import builtins
+import errno
+import json
+import os
 from pathlib import Path
-from typing import Literal, final
+import pstats
+from resource import RLIMIT_AS, getrlimit, setrlimit
+from signal import ITIMER_REAL, SIGALRM, setitimer, signal
+import sys
+from time import perf_counter
+import tracemalloc
+from types import CodeType, FrameType, ModuleType
+from typing import Final, Literal, Self, final
+
+from cache import DEFAULT_MAX_BYTES, InputCache
+
+ROOT: Final = Path(__file__).resolve(strict=True).parent
+
+PARTS: Final[tuple[Literal[1, 2], ...]] = (1, 2)
+
+DEFAULT_INPUTS: Final = ('input', 'input.txt')
+
+# What the dynamic loader reports when mapping a C extension runs into the
+# address-space limit. It raises a plain ImportError with no errno.
+OUT_OF_MEMORY_IMPORTS: Final = (
+    'failed to map segment',
+    os.strerror(errno.ENOMEM),
+)
 
 
 @final
 @dataclass(frozen=True, kw_only=True, slots=True)
 class Arguments:
-    part: Literal[1, 2]
-    input_path: Path
+    selectors: list[str]
+    parts: tuple[Literal[1, 2], ...]
+    input_name: str | None
+    verbose: bool
+    jobs: int | None
+    timeout: float | None
+    memory_limit: int | None
+    cache: InputCache | None
+    profile_path: Path | None
+    profile_top: int
+    trace_memory: bool
+    json: bool
+    check: bool
 
 
 def parse_args() -> Arguments:
     parser = ArgumentParser()
-    parser.add_argument('part', default=1, choices=(1, 2), type=int)
-    parser.add_argument('input', nargs='?', type=Path)
+    parser.add_argument('selectors', nargs='*', metavar='YEAR[/DAY]')
+    parser.add_argument(
+        '-p', '--part', action='append', choices=PARTS, type=int
+    )
+    parser.add_argument('-i', '--input', metavar='NAME')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    parser.add_argument(
+        '-j', '--jobs', nargs='?', const=0, type=int, metavar='N'
+    )
+    parser.add_argument('-t', '--timeout', type=float, metavar='SECONDS')
+    parser.add_argument('-m', '--memory-limit', type=int, metavar='MIB')
+    parser.add_argument('-c', '--cache', action='store_true')
+    parser.add_argument(
+        '--cache-size', default=DEFAULT_MAX_BYTES >> 20, type=int, metavar='MIB'
+    )
+    parser.add_argument('--profile', type=Path, metavar='PSTATS')
+    parser.add_argument('--profile-top', default=25, type=int, metavar='N')
+    parser.add_argument('--trace-memory', action='store_true')
+    parser.add_argument('--json', action='store_true')
+    parser.add_argument('--check', action='store_true')
     args = parser.parse_args()
-    if args.input is None:
-        input_path = Path(__file__).resolve(strict=True).parent / 'input'
-    else:
-        input_path = args.input
-    return Arguments(part=args.part, input_path=input_path)
+    if args.profile is not None and args.jobs is not None:
+        parser.error('--profile cannot follow jobs into worker processes')
+    return Arguments(
+        selectors=args.selectors,
+        parts=PARTS if args.part is None else tuple(sorted(set(args.part))),
+        input_name=args.input,
+        verbose=args.verbose,
+        jobs=None if args.jobs is None else args.jobs or os.cpu_count(),
+        timeout=args.timeout,
+        memory_limit=(
+            None if args.memory_limit is None else args.memory_limit << 20
+        ),
+        cache=InputCache(max_bytes=args.cache_size << 20)
+        if args.cache
+        else None,
+        profile_path=args.profile,
+        profile_top=args.profile_top,
+        trace_memory=args.trace_memory,
+        json=args.json,
+        check=args.check,
+    )
+
+
+@final
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Day:
+    year: int
+    day: int
+    path: Path
+
+    def __str__(self) -> str:
+        return f'{self.year}/{self.day:02}'
+
+    @property
+    def module_name(self) -> str:
+        return f'aoc_{self.year}_{self.day:02}'
+
+    def input_path(self, name: str | None = None) -> Path:
+        directory = self.path.parent
+        if name is not None:
+            return directory / name
+        for default in DEFAULT_INPUTS:
+            path = directory / default
+            if path.exists():
+                return path
+        # Some days take their puzzle input as an option instead; those that
+        # do read a file fail on opening it.
+        return directory / DEFAULT_INPUTS[0]
+
+
+def parse_selector(text: str) -> tuple[int, int | None]:
+    year, _, day = text.partition('/')
+    return int(year), int(day) if day else None
+
+
+def find_days(selectors: Iterable[str] = ()) -> list[Day]:
+    wanted = [parse_selector(selector) for selector in selectors]
+    days: list[Day] = []
+    for path in sorted(ROOT.glob('[0-9][0-9][0-9][0-9]/[0-9][0-9]/aoc.py')):
+        day = Day(
+            year=int(path.parent.parent.name),
+            day=int(path.parent.name),
+            path=path,
+        )
+        if not wanted or any(
+            year == day.year and (number is None or number == day.day)
+            for year, number in wanted
+        ):
+            days.append(day)
+    return days
+
+
+class UnsupportedDay(Exception):
+    pass
+
+
+@final
+class Solution:
+    """The loader and parts of a day, as called by its ``main()``.
+
+    The loader is the argument expression ``main()`` passes to ``part(...)``,
+    or to ``part_1(...)`` and ``part_2(...)`` when it calls them directly.
+    Locals that ``main()`` assigns once are substituted into it, and it is
+    evaluated against the module with ``args`` bound to the day's arguments
+    for the input and part, so days keep whatever loading convention they
+    already have.
+
+    A day whose loader reads options besides ``args.part`` and
+    ``args.input_path`` says what they default to by defining
+    ``default_arguments(input_path, part)``, which returns the same
+    ``Arguments`` its ``parse_args()`` would.
+    """
+
+    def __init__(self, day: Day, module: ModuleType) -> None:
+        self.day: Final = day
+        self.module: Final = module
+        parts: dict[int, Callable[..., object]] = {}
+        for part in PARTS:
+            function = getattr(module, f'part_{part}', None)
+            if not callable(function):
+                raise UnsupportedDay(f'{day} has no part_{part}()')
+            parts[part] = function
+        self.parts: Final = parts
+        arguments, self.load_uses_part = self._compile_arguments()
+        self._arguments: Final = arguments
+
+    def _compile_arguments(
+        self,
+    ) -> tuple[dict[Literal[1, 2], CodeType], bool]:
+        source = self.day.path.read_text()
+        tree = ast.parse(source, filename=str(self.day.path))
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef) and node.name == 'main':
+                main = node
+                break
+        else:
+            raise UnsupportedDay(f'{self.day} has no main()')
+        calls: dict[str, ast.Call] = {}
+        assignments: dict[str, list[ast.expr]] = {}
+        for child in ast.walk(main):
+            if (
+                isinstance(child, ast.Call)
+                and isinstance(child.func, ast.Name)
+                and child.func.id in ('part', 'part_1', 'part_2')
+            ):
+                calls.setdefault(child.func.id, child)
+            elif isinstance(child, ast.Assign) and len(child.targets) == 1:
+                [target] = child.targets
+                if isinstance(target, ast.Name):
+                    assignments.setdefault(target.id, []).append(child.value)
+        if 'part' in calls:
+            call = calls['part']
+            per_part = dict.fromkeys(PARTS, call)
+        elif 'part_1' in calls and 'part_2' in calls:
+            per_part = {part: calls[f'part_{part}'] for part in PARTS}
+        else:
+            raise UnsupportedDay(f'{self.day} main() never calls part(...)')
+        locals = {
+            name: values[0]
+            for name, values in assignments.items()
+            if len(values) == 1 and name != 'args'
+        }
+        uses: set[str] = set()
+        arguments: dict[Literal[1, 2], CodeType] = {}
+        for part, call in per_part.items():
+            if call.keywords:
+                raise UnsupportedDay(
+                    f'{self.day} calls {ast.unparse(call.func)}(...) with'
+                    ' keywords'
+                )
+            expression = _Substitute(locals).visit(
+                ast.Tuple(elts=call.args, ctx=ast.Load())
+            )
+            for child in ast.walk(expression):
+                if isinstance(child, ast.Attribute) and (
+                    isinstance(child.value, ast.Name)
+                    and child.value.id == 'args'
+                ):
+                    uses.add(child.attr)
+                elif (
+                    isinstance(child, ast.Name)
+                    and child.id != 'args'
+                    and not hasattr(self.module, child.id)
+                    and not hasattr(builtins, child.id)
+                ):
+                    raise UnsupportedDay(
+                        f'{self.day} part(...) needs local {child.id!r}'
+                    )
+            expression = ast.fix_missing_locations(ast.Expression(expression))
+            arguments[part] = compile(expression, str(self.day.path), 'eval')
+        options = uses - {'part', 'input_path'}
+        if options and not callable(
+            getattr(self.module, 'default_arguments', None)
+        ):
+            raise UnsupportedDay(
+                f'{self.day} part(...) needs args.{min(options)} but the day'
+                ' has no default_arguments()'
+            )
+        return arguments, 'part' in uses or 'part' not in calls
+
+    def arguments(self, input_path: Path, part: Literal[1, 2]) -> object:
+        default_arguments = getattr(self.module, 'default_arguments', None)
+        if callable(default_arguments):
+            return default_arguments(input_path, part)
+        return SolutionArguments(input_path=input_path, part=part)
+
+    def load(self, input_path: Path, part: Literal[1, 2]) -> tuple[object, ...]:
+        args = self.arguments(input_path, part)
+        return eval(self._arguments[part], vars(self.module), {'args': args})
+
+
+@final
+class _Substitute(ast.NodeTransformer):
+    """Replaces names with the expressions ``main()`` assigned to them."""
+
+    def __init__(self, locals: Mapping[str, ast.expr]) -> None:
+        self.locals: Final = locals
+        self.active: Final[set[str]] = set()
+
+    def visit_Name(self, node: ast.Name) -> ast.expr:
+        value = self.locals.get(node.id)
+        if value is None or node.id in self.active:
+            return node
+        self.active.add(node.id)
+        try:
+            substituted: ast.expr = self.visit(copy.deepcopy(value))
+            return substituted
+        finally:
+            self.active.remove(node.id)
+
+
+@final
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SolutionArguments:
+    input_path: Path
+    part: Literal[1, 2]
+
+
+def import_day(day: Day) -> ModuleType:
+    module = sys.modules.get(day.module_name)
+    if module is not None:
+        return module
+    spec = spec_from_file_location(day.module_name, day.path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f'cannot import {day.path}')
+    module = module_from_spec(spec)
+    sys.modules[day.module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[day.module_name]
+        raise
+    return module
+
+
+@final
+@unique
+class Status(Enum):
+    OK = auto()
+    ERROR = auto()
+    TIMEOUT = auto()
+    MEMORY = auto()
+    CRASHED = auto()
 
+    @classmethod
+    def of(cls, error: BaseException) -> Self:
+        return cls.ERROR if out_of_memory(error) is None else cls.MEMORY
 
-type Input = object
 
+def out_of_memory(error: BaseException) -> BaseException | None:
+    """The innermost error in ``error``'s chain that ran out of memory.
 
-def load_input(path: Path) -> Input:
-    with open(path) as file:
-        pass
+    Under ``-m`` the limit is as likely to surface while loading a C
+    extension, as an ImportError or OSError, as it is as a MemoryError.
+    """
+    found: BaseException | None = None
+    seen: set[int] = set()
+    cause: BaseException | None = error
+    while cause is not None and id(cause) not in seen:
+        seen.add(id(cause))
+        match cause:
+            case MemoryError() | OSError(errno=errno.ENOMEM):
+                found = cause
+            case ImportError() if any(
+                message in str(cause) for message in OUT_OF_MEMORY_IMPORTS
+            ):
+                found = cause
+        cause = cause.__cause__ or cause.__context__
+    return found
 
 
-type Result = int
+@final
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Run:
+    day: Day
+    part: Literal[1, 2]
+    status: Status = Status.OK
+    import_time: float = 0.0
+    load_time: float = 0.0
+    solve_time: float = 0.0
+    load_peak: int | None = None
+    solve_peak: int | None = None
+    answer: object = None
+    error: str | None = None
+
+    @property
+    def total_time(self) -> float:
+        return self.import_time + self.load_time + self.solve_time
+
+    def to_record(self) -> dict[str, object]:
+        return {
+            'day': str(self.day),
+            'part': self.part,
+            'status': self.status.name.lower(),
+            'import_time': self.import_time,
+            'load_time': self.load_time,
+            'solve_time': self.solve_time,
+            'load_peak': self.load_peak,
+            'solve_peak': self.solve_peak,
+            'answer': None if self.answer is None else str(self.answer),
+            'error': self.error,
+        }
+
+
+def describe_error(error: BaseException) -> str:
+    # What ran out of memory says more than what the day made of it, such
+    # as numpy's page of advice on a failed import.
+    error = out_of_memory(error) or error
+    text = str(error)
+    return f'{type(error).__name__}: {text}' if text else type(error).__name__
+
+
+def reset_peak() -> int:
+    tracemalloc.reset_peak()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def peak_since(baseline: int) -> int:
+    return tracemalloc.get_traced_memory()[1] - baseline
+
 
+def run_day(
+    day: Day,
+    parts: Sequence[Literal[1, 2]] = PARTS,
+    input_name: str | None = None,
+    cache: InputCache | None = None,
+    trace_memory: bool = False,
+) -> list[Run]:
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    start = perf_counter()
+    try:
+        solution = Solution(day, import_day(day))
+        input_path = day.input_path(input_name)
+    except JobTimeout as timeout:
+        return [
+            Run(
+                day=day,
+                part=part,
+                status=Status.TIMEOUT,
+                import_time=perf_counter() - start,
+                error=f'import {timeout}',
+            )
+            for part in parts
+        ]
+    except Exception as error:
+        return [
+            Run(
+                day=day,
+                part=part,
+                status=Status.of(error),
+                error=describe_error(error),
+            )
+            for part in parts
+        ]
+    import_time = perf_counter() - start
+    runs: list[Run] = []
+    for part in parts:
+        load_time = solve_time = 0.0
+        load_peak = solve_peak = None
+        stage = 'load'
+        try:
+            if trace_memory:
+                baseline = reset_peak()
+            start = perf_counter()
+            if cache is None:
+                arguments = solution.load(input_path, part)
+            else:
+                arguments = cache.load(solution, input_path, part)
+            load_time = perf_counter() - start
+            if trace_memory:
+                load_peak = peak_since(baseline)
+                baseline = reset_peak()
+            stage = 'solve'
+            start = perf_counter()
+            answer = solution.parts[part](*arguments)
+            solve_time = perf_counter() - start
+            if trace_memory:
+                solve_peak = peak_since(baseline)
+        except JobTimeout as timeout:
+            # Only the stage that was running timed out; the ones before it
+            # finished and keep their times.
+            if stage == 'load':
+                load_time = perf_counter() - start
+            else:
+                solve_time = perf_counter() - start
+            runs.append(
+                Run(
+                    day=day,
+                    part=part,
+                    status=Status.TIMEOUT,
+                    import_time=import_time,
+                    load_time=load_time,
+                    solve_time=solve_time,
+                    load_peak=load_peak,
+                    error=f'{stage} {timeout}',
+                )
+            )
+            break
+        except Exception as error:
+            runs.append(
+                Run(
+                    day=day,
+                    part=part,
+                    status=Status.of(error),
+                    import_time=import_time,
+                    load_time=load_time,
+                    load_peak=load_peak,
+                    error=describe_error(error),
+                )
+            )
+        else:
+            runs.append(
+                Run(
+                    day=day,
+                    part=part,
+                    import_time=import_time,
+                    load_time=load_time,
+                    solve_time=solve_time,
+                    load_peak=load_peak,
+                    solve_peak=solve_peak,
+                    answer=answer,
+                )
+            )
+        import_time = 0.0
+    return runs
+
+
+class JobTimeout(BaseException):
+    """Raised from ``SIGALRM`` when a job overruns its wall-clock timeout.
+
+    It derives from ``BaseException`` so that ``except Exception`` in a day
+    cannot swallow it.
+    """
+
+
+@contextmanager
+def limits(timeout: float | None, memory_limit: int | None) -> Iterator[None]:
+    def expire(signum: int, frame: FrameType | None) -> None:
+        raise JobTimeout(f'exceeded {timeout} s')
+
+    soft, hard = getrlimit(RLIMIT_AS)
+    if memory_limit is not None:
+        setrlimit(RLIMIT_AS, (memory_limit, hard))
+    previous = signal(SIGALRM, expire)
+    if timeout is not None:
+        setitimer(ITIMER_REAL, timeout)
+    try:
+        yield
+    finally:
+        try:
+            setitimer(ITIMER_REAL, 0)
+        finally:
+            signal(SIGALRM, previous)
+            setrlimit(RLIMIT_AS, (soft, hard))
 
-def part_1(input: Input) -> Result:
-    return 0
 
+@final
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Job:
+    day: Day
+    part: Literal[1, 2]
+    input_name: str | None = None
+    timeout: float | None = None
+    memory_limit: int | None = None
+    cache: InputCache | None = None
+    trace_memory: bool = False
+    verbose: bool = False
 
-def part_2(input: Input) -> Result:
-    return 0
+
+def run_job(job: Job) -> Run:
+    try:
+        with (
+            open(os.devnull, 'w') as devnull,
+            nullcontext() if job.verbose else redirect_stdout(devnull),
+            limits(job.timeout, job.memory_limit),
+        ):
+            [run] = run_day(
+                job.day,
+                (job.part,),
+                job.input_name,
+                job.cache,
+                job.trace_memory,
+            )
+    except JobTimeout as timeout:
+        # The alarm went off between stages, so no stage is to blame.
+        return Run(
+            day=job.day,
+            part=job.part,
+            status=Status.TIMEOUT,
+            error=str(timeout),
+        )
+    # The answer may be of a class from the day, which the parent process
+    # has not imported and so could not unpickle.
+    if run.answer is None:
+        return run
+    return replace(run, answer=str(run.answer))
+
+
+def run_jobs(jobs: Sequence[Job], workers: int | None) -> Iterator[Run]:
+    if workers is None:
+        yield from map(run_job, jobs)
+        return
+    pending = list(jobs)
+    while pending:
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(run_job, job) for job in pending]
+            for index, future in enumerate(futures):
+                try:
+                    run = future.result()
+                except BrokenProcessPool:
+                    break
+                yield run
+            else:
+                return
+        # A crash breaks the whole pool, so the first unfinished job may
+        # only have been running beside the one that crashed. Run it alone
+        # to tell, then go on with the rest in a fresh pool.
+        yield run_isolated(pending[index])
+        pending = pending[index + 1 :]
+
+
+def run_isolated(job: Job) -> Run:
+    with ProcessPoolExecutor(1) as executor:
+        try:
+            return executor.submit(run_job, job).result()
+        except BrokenProcessPool as error:
+            return Run(
+                day=job.day,
+                part=job.part,
+                status=Status.CRASHED,
+                error=describe_error(error),
+            )
+
+
+def defines_parts(day: Day) -> bool:
+    try:
+        tree = ast.parse(day.path.read_text(), filename=str(day.path))
+    except SyntaxError:
+        return False
+    names = {
+        node.name for node in tree.body if isinstance(node, ast.FunctionDef)
+    }
+    return all(f'part_{part}' in names for part in PARTS)
+
+
+def check_day(day: Day) -> UnsupportedDay | None:
+    """Why the runner cannot run a day that defines its parts, if it can't.
+
+    Only the runner's side is checked: the loader is found and the day's
+    arguments are built, but nothing is loaded or solved. A day whose own code
+    fails to import is left to show up as an error when it is run.
+    """
+    try:
+        module = import_day(day)
+    except Exception:
+        return None
+    try:
+        solution = Solution(day, module)
+        for part in PARTS:
+            solution.arguments(day.input_path(), part)
+    except UnsupportedDay as error:
+        return error
+    return None
+
+
+def check(days: Iterable[Day]) -> int:
+    failures = 0
+    for day in days:
+        if not defines_parts(day):
+            continue
+        with redirect_stdout(sys.stderr):
+            error = check_day(day)
+        if error is not None:
+            print(f'{day}  ! {error}', flush=True)
+            failures += 1
+    return failures
+
+
+def format_time(seconds: float) -> str:
+    if seconds >= 1:
+        return f'{seconds:8.3f} s '
+    return f'{seconds * 1000:8.3f} ms'
+
+
+def format_size(size: int | None) -> str:
+    if size is None:
+        return f'{"-":>8}   '
+    return f'{size / (1 << 20):8.3f} MiB'
+
+
+def format_run(run: Run) -> str:
+    if run.status is Status.OK:
+        result = str(run.answer)
+    else:
+        result = f'! {run.status.name.lower()}: {run.error}'
+    memory = ''
+    if run.load_peak is not None:
+        memory = (
+            f'  peak load {format_size(run.load_peak)}'
+            f' solve {format_size(run.solve_peak)}'
+        )
+    return (
+        f'{run.day} part {run.part}'
+        f'  import {format_time(run.import_time)}'
+        f'  load {format_time(run.load_time)}'
+        f'  solve {format_time(run.solve_time)}'
+        f'{memory}'
+        f'  {result}'
+    )
 
 
 def main() -> None:
     args = parse_args()
-    match args.part:
-        case 1:
-            part = part_1
-        case 2:
-            part = part_2
-    print(part(load_input(args.input_path)))
+    if args.check:
+        if check(find_days(args.selectors)):
+            raise SystemExit(1)
+        return
+    jobs = [
+        Job(
+            day=day,
+            part=part,
+            input_name=args.input_name,
+            timeout=args.timeout,
+            memory_limit=args.memory_limit,
+            cache=args.cache,
+            trace_memory=args.trace_memory,
+            verbose=args.verbose,
+        )
+        for day in find_days(args.selectors)
+        for part in args.parts
+    ]
+    profiler = None if args.profile_path is None else cProfile.Profile()
+    start = perf_counter()
+    total = 0.0
+    failures = 0
+    if profiler is not None:
+        profiler.enable()
+    for run in run_jobs(jobs, args.jobs):
+        if args.json:
+            print(json.dumps(run.to_record()), flush=True)
+        else:
+            print(format_run(run), flush=True)
+        total += run.total_time
+        failures += run.status is not Status.OK
+    if profiler is not None:
+        assert args.profile_path is not None
+        profiler.disable()
+        profiler.dump_stats(args.profile_path)
+        if not args.json:
+            stats = pstats.Stats(profiler)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE)
+            stats.print_stats(args.profile_top)
+    if not args.json:
+        print(
+            f'total {format_time(total)}'
+            f', wall {format_time(perf_counter() - start)}'
+            f', {failures} failed'
+        )
+    if failures:
+        raise SystemExit(1)
 
 
 if __name__ == '__main__':
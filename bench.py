@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+from argparse import ArgumentParser
+from collections.abc import Iterator, Sequence
+from contextlib import nullcontext, redirect_stdout
+from dataclasses import dataclass
+import gc
+import json
+from math import inf
+import os
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+from typing import Final, Literal, Self, final
+
+from aoc import (
+    PARTS,
+    ROOT,
+    Day,
+    Solution,
+    describe_error,
+    find_days,
+    format_time,
+    import_day,
+)
+
+STAGES: Final = ('load', 'solve')
+
+# The one stage of a part whose loader only sets up a stream.
+STREAMED: Final = 'load+solve'
+
+
+@final
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Arguments:
+    selectors: list[str]
+    parts: tuple[Literal[1, 2], ...]
+    input_name: str | None
+    warmup: int
+    repeats: int
+    baseline_path: Path
+    save: bool
+    threshold: float
+    verbose: bool
+
+
+def parse_args() -> Arguments:
+    parser = ArgumentParser()
+    parser.add_argument('selectors', nargs='*', metavar='YEAR[/DAY]')
+    parser.add_argument(
+        '-p', '--part', action='append', choices=PARTS, type=int
+    )
+    parser.add_argument('-i', '--input', metavar='NAME')
+    parser.add_argument('-w', '--warmup', default=1, type=int)
+    parser.add_argument('-r', '--repeats', default=5, type=int)
+    parser.add_argument(
+        '-b', '--baseline', default=ROOT / 'bench.json', type=Path
+    )
+    parser.add_argument('-s', '--save', action='store_true')
+    parser.add_argument('-t', '--threshold', default=0.1, type=float)
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args()
+    if args.repeats < 1:
+        parser.error('repeats must be at least 1')
+    return Arguments(
+        selectors=args.selectors,
+        parts=PARTS if args.part is None else tuple(sorted(set(args.part))),
+        input_name=args.input,
+        warmup=args.warmup,
+        repeats=args.repeats,
+        baseline_path=args.baseline,
+        save=args.save,
+        threshold=args.threshold,
+        verbose=args.verbose,
+    )
+
+
+@final
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Timing:
+    median: float
+    mad: float
+
+    @classmethod
+    def from_samples(cls, samples: Sequence[float]) -> Self:
+        middle = median(samples)
+        return cls(
+            median=middle,
+            mad=median(abs(sample - middle) for sample in samples),
+        )
+
+
+type Timings = dict[str, Timing]
+
+type Baseline = dict[str, dict[str, dict[str, float]]]
+
+
+def measure_part(
+    solution: Solution, input_path: Path, part: Literal[1, 2]
+) -> dict[str, float]:
+    """Seconds one run of a part spends in each stage.
+
+    A loader that returns an iterator has only opened a stream, and the
+    parsing happens as the part reads it. Splitting such a run would credit
+    all of it to the part, so it is timed as one ``STREAMED`` stage.
+    """
+    gc.collect()
+    start = perf_counter()
+    arguments = solution.load(input_path, part)
+    middle = perf_counter()
+    solution.parts[part](*arguments)
+    end = perf_counter()
+    if any(isinstance(argument, Iterator) for argument in arguments):
+        return {STREAMED: end - start}
+    return dict(zip(STAGES, (middle - start, end - middle), strict=True))
+
+
+def bench_part(
+    solution: Solution,
+    input_path: Path,
+    part: Literal[1, 2],
+    warmup: int,
+    repeats: int,
+) -> Timings:
+    for _ in range(warmup):
+        measure_part(solution, input_path, part)
+    samples = [measure_part(solution, input_path, part) for _ in range(repeats)]
+    return {
+        stage: Timing.from_samples([sample[stage] for sample in samples])
+        for stage in samples[0]
+    }
+
+
+def part_key(day: Day, part: Literal[1, 2]) -> str:
+    return f'{day} part {part}'
+
+
+def load_baseline(path: Path) -> Baseline:
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path: Path, baseline: Baseline) -> None:
+    with open(path, 'w') as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def format_timing(timing: Timing) -> str:
+    return f'{format_time(timing.median)} ± {format_time(timing.mad)}'
+
+
+def compare(timing: Timing, baseline: dict[str, float] | None) -> str:
+    if baseline is None:
+        return ''
+    if baseline['median']:
+        change = timing.median / baseline['median'] - 1
+    else:
+        # A baseline too quick for the clock to see has no ratio to scale.
+        change = inf if timing.median else 0.0
+    return f'{change:+7.1%}'
+
+
+def is_regression(
+    timing: Timing, baseline: dict[str, float] | None, threshold: float
+) -> bool:
+    if baseline is None:
+        return False
+    slowdown = timing.median - baseline['median']
+    noise = max(timing.mad, baseline['mad'])
+    return slowdown > baseline['median'] * threshold and slowdown > 3 * noise
+
+
+def bench_day(
+    day: Day, args: Arguments, baseline: Baseline, results: Baseline
+) -> int:
+    regressions = 0
+    try:
+        solution = Solution(day, import_day(day))
+        input_path = day.input_path(args.input_name)
+    except Exception as error:
+        print(f'{day}  ! {describe_error(error)}')
+        return regressions
+    for part in args.parts:
+        key = part_key(day, part)
+        try:
+            with (
+                open(os.devnull, 'w') as devnull,
+                nullcontext() if args.verbose else redirect_stdout(devnull),
+            ):
+                timings = bench_part(
+                    solution, input_path, part, args.warmup, args.repeats
+                )
+        except Exception as error:
+            print(f'{key}  ! {describe_error(error)}')
+            continue
+        results[key] = {
+            stage: {'median': timing.median, 'mad': timing.mad}
+            for stage, timing in timings.items()
+        }
+        columns = [key]
+        for stage, timing in timings.items():
+            previous = baseline.get(key, {}).get(stage)
+            regressed = is_regression(timing, previous, args.threshold)
+            regressions += regressed
+            flag = ' REGRESSION' if regressed else ''
+            columns.append(
+                f'{stage} {format_timing(timing)}'
+                f' {compare(timing, previous)}{flag}'
+            )
+        print('  '.join(columns))
+    return regressions
+
+
+def main() -> None:
+    args = parse_args()
+    baseline = load_baseline(args.baseline_path)
+    results: Baseline = {}
+    regressions = 0
+    for day in find_days(args.selectors):
+        regressions += bench_day(day, args, baseline, results)
+    if args.save:
+        save_baseline(args.baseline_path, baseline | results)
+    if regressions:
+        print(f'{regressions} stages regressed by over {args.threshold:.0%}')
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except KeyboardInterrupt:
+        raise SystemExit(1)
@@ -0,0 +1,173 @@
+import ast
+from dataclasses import dataclass
+from functools import cache
+from hashlib import blake2b, file_digest
+import os
+from pathlib import Path
+import pickle
+from typing import TYPE_CHECKING, Final, Literal, final
+
+if TYPE_CHECKING:
+    from aoc import Solution
+
+ROOT: Final = Path(__file__).resolve(strict=True).parent
+
+DEFAULT_DIRECTORY: Final = ROOT / '.cache' / 'inputs'
+
+DEFAULT_MAX_BYTES: Final = 256 << 20
+
+SUFFIX: Final = '.pickle'
+
+SKIP_SUFFIX: Final = '.skip'
+
+UNPICKLABLE: Final = (
+    pickle.PicklingError,
+    TypeError,
+    AttributeError,
+    RecursionError,
+)
+
+
+@cache
+def _hash_file(path: Path, mtime_ns: int, size: int) -> bytes:
+    with open(path, 'rb') as file:
+        return file_digest(file, 'blake2b').digest()
+
+
+def hash_file(path: Path) -> bytes:
+    stat = path.stat()
+    return _hash_file(path.resolve(), stat.st_mtime_ns, stat.st_size)
+
+
+@cache
+def _imported_modules(path: Path, mtime_ns: int, size: int) -> frozenset[Path]:
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    modules: set[Path] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif (
+            isinstance(node, ast.ImportFrom) and not node.level and node.module
+        ):
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            module = ROOT / f'{name.partition(".")[0]}.py'
+            if module.is_file():
+                modules.add(module)
+    return frozenset(modules)
+
+
+def local_modules(path: Path) -> list[Path]:
+    """Repo-local modules ``path`` imports, directly or through each other."""
+    root = path.resolve()
+    seen = {root}
+    pending = [root]
+    while pending:
+        source = pending.pop()
+        stat = source.stat()
+        for module in _imported_modules(source, stat.st_mtime_ns, stat.st_size):
+            if module not in seen:
+                seen.add(module)
+                pending.append(module)
+    seen.remove(root)
+    return sorted(seen)
+
+
+def dumps(value: object) -> bytes:
+    # Linked graphs recurse once per node and so stop at the C recursion
+    # limit, which raises RecursionError like any other unpicklable value.
+    # Loaders whose graphs are that deep pickle themselves flat instead.
+    return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+
+@final
+@dataclass(frozen=True, kw_only=True, slots=True)
+class InputCache:
+    """Content-addressed on-disk cache of parsed inputs.
+
+    Entries are keyed on the hash of the input file, of the day's source and
+    of the repo-local modules it imports, so editing any of them misses the
+    cache rather than returning stale data.
+    The directory is kept under ``max_bytes`` by evicting the least recently
+    used entries, using the modification time that hits refresh.
+    """
+
+    directory: Path = DEFAULT_DIRECTORY
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    def key(
+        self, solution: 'Solution', input_path: Path, part: Literal[1, 2]
+    ) -> str:
+        hasher = blake2b(digest_size=20)
+        # Days that take their puzzle as an option have no input file.
+        if input_path.exists():
+            hasher.update(hash_file(input_path))
+        hasher.update(hash_file(solution.day.path))
+        for module in local_modules(solution.day.path):
+            hasher.update(hash_file(module))
+        if solution.load_uses_part:
+            hasher.update(bytes((part,)))
+        return hasher.hexdigest()
+
+    def load(
+        self, solution: 'Solution', input_path: Path, part: Literal[1, 2]
+    ) -> tuple[object, ...]:
+        path = self.directory / self.key(solution, input_path, part)
+        path = path.with_suffix(SUFFIX)
+        try:
+            with open(path, 'rb') as file:
+                arguments = pickle.load(file)
+        except FileNotFoundError:
+            pass
+        except (pickle.UnpicklingError, EOFError, AttributeError):
+            path.unlink(missing_ok=True)
+        else:
+            os.utime(path)
+            return arguments
+        arguments = solution.load(input_path, part)
+        self.store(path, arguments)
+        return arguments
+
+    def store(self, path: Path, arguments: tuple[object, ...]) -> None:
+        skip = path.with_suffix(SKIP_SUFFIX)
+        if skip.exists():
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        try:
+            data = dumps(arguments)
+        except UNPICKLABLE:
+            # Generators and the like are parsed every time; remember that
+            # rather than paying for a failed pickle on every run.
+            skip.touch()
+            return
+        if len(data) > self.max_bytes:
+            skip.touch()
+            return
+        temporary = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        temporary.write_bytes(data)
+        os.replace(temporary, path)
+        self.evict()
+
+    def evict(self) -> None:
+        entries: list[tuple[int, int, Path]] = []
+        total = 0
+        for path in self.directory.glob(f'*{SUFFIX}'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        for suffix in (SUFFIX, SKIP_SUFFIX):
+            for path in self.directory.glob(f'*{suffix}'):
+                path.unlink(missing_ok=True)
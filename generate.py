@@ -0,0 +1,984 @@
+#!/usr/bin/env python
+"""Seeded generators for synthetic puzzle inputs at arbitrary scale.
+
+Every generator takes a ``Random`` and a size, the meaning of which depends
+on the day (lines, grid side, wires, ...), and yields the text of a valid
+input. The same day, size and seed always give the same bytes, so a
+generated file can be rebuilt rather than checked in::
+
+    ./generate.py 2024/01 -n 10000000 -o /tmp/2024-01.txt
+    ./aoc.py 2024/01 -i /tmp/2024-01.txt
+"""
+
+from argparse import ArgumentParser
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+import json
+from pathlib import Path
+from random import Random
+import sys
+from typing import Final, NamedTuple, final
+
+type Generator = Callable[[Random, int], Iterable[str]]
+
+BLOCK: Final = 1 << 16
+
+SYLLABLES: Final = (
+    'al', 'an', 'ar', 'be', 'ca', 'da', 'el', 'en', 'fa', 'ga', 'ha', 'in',
+    'ja', 'ka', 'la', 'li', 'ma', 'mo', 'na', 'ni', 'or', 'pa', 'ra', 'ri',
+    'sa', 'so', 'ta', 'th', 'ul', 'va', 'wi', 'yo', 'za',
+)  # fmt: skip
+
+
+@final
+class Entry(NamedTuple):
+    generate: Generator
+    size: int
+
+
+GENERATORS: Final[dict[str, Entry]] = {}
+
+
+def generator(day: str, size: int) -> Callable[[Generator], Generator]:
+    def register(generate: Generator) -> Generator:
+        GENERATORS[day] = Entry(generate, size)
+        return generate
+
+    return register
+
+
+def characters(
+    rng: Random,
+    alphabet: str,
+    count: int,
+    weights: Iterable[float] | None = None,
+) -> Iterator[str]:
+    """``count`` characters drawn from ``alphabet`` in blocks."""
+    weights = None if weights is None else list(weights)
+    while count > 0:
+        size = min(count, BLOCK)
+        yield ''.join(rng.choices(alphabet, weights, k=size))
+        count -= size
+
+
+def cells(rng: Random, count: int, densities: dict[str, float]) -> bytes:
+    """``count`` grid cells, each character at roughly its density.
+
+    Whatever the densities leave over is ``.``. Working from random bytes
+    through a translation table keeps multi-million-cell grids fast.
+    """
+    codes = bytearray(b'.') * 256
+    start = 0
+    for character, density in densities.items():
+        end = start + round(density * 256)
+        codes[start:end] = character.encode() * (end - start)
+        start = end
+    return rng.randbytes(count).translate(codes)
+
+
+def grid_lines(cells: bytes | bytearray, width: int) -> Iterator[str]:
+    for start in range(0, len(cells), width):
+        yield cells[start : start + width].decode('ascii') + '\n'
+
+
+def names(rng: Random, count: int) -> list[str]:
+    """``count`` distinct capitalised made-up names."""
+    seen: set[str] = set()
+    length = 2
+    while len(seen) < count:
+        attempts = 0
+        while len(seen) < count and attempts < 4 * count:
+            seen.add(''.join(rng.choices(SYLLABLES, k=length)).capitalize())
+            attempts += 1
+        length += 1
+    result = sorted(seen)
+    rng.shuffle(result)
+    return result
+
+
+def wire_name(index: int) -> str:
+    """Bijective base-26: a, b, ..., z, aa, ab, ..."""
+    name = ''
+    index += 1
+    while index:
+        index, letter = divmod(index - 1, 26)
+        name = chr(ord('a') + letter) + name
+    return name
+
+
+@generator('2015/01', 7000)
+def generate_2015_01(rng: Random, size: int) -> Iterator[str]:
+    # Drift downwards first, then step down to the basement whatever the
+    # drift did, so part 2 always has an answer.
+    descent = size // 4
+    floor = 0
+    for block in characters(rng, '()', descent, (0.49, 0.51)):
+        floor += block.count('(') - block.count(')')
+        yield block
+    steps = max(0, floor + 1)
+    yield ')' * steps
+    yield from characters(
+        rng, '()', max(0, size - descent - steps), (0.51, 0.49)
+    )
+    yield '\n'
+
+
+@generator('2015/02', 1000)
+def generate_2015_02(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        length, width, height = (rng.randint(1, 30) for _ in range(3))
+        yield f'{length}x{width}x{height}\n'
+
+
+@generator('2015/03', 8192)
+def generate_2015_03(rng: Random, size: int) -> Iterator[str]:
+    yield from characters(rng, '^v<>', size)
+    yield '\n'
+
+
+@generator('2015/04', 8)
+def generate_2015_04(rng: Random, size: int) -> Iterator[str]:
+    yield ''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=size)) + '\n'
+
+
+@generator('2015/05', 1000)
+def generate_2015_05(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield ''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=16)) + '\n'
+
+
+@generator('2015/06', 300)
+def generate_2015_06(rng: Random, size: int) -> Iterator[str]:
+    actions = ('toggle', 'turn on', 'turn off')
+    for _ in range(size):
+        x_1, x_2 = sorted((rng.randrange(1000), rng.randrange(1000)))
+        y_1, y_2 = sorted((rng.randrange(1000), rng.randrange(1000)))
+        action = rng.choice(actions)
+        yield f'{action} {x_1},{y_1} through {x_2},{y_2}\n'
+
+
+@generator('2015/07', 339)
+def generate_2015_07(rng: Random, size: int) -> Iterator[str]:
+    # Wires are defined in a random order but only ever read wires created
+    # before them, mostly recent ones, so the circuit is a deep DAG ending in
+    # ``a``. ``b`` is a constant so part 2 can override it.
+    size = max(size, 4)
+    wires = ['b', *(wire_name(i) for i in range(2, size - 1)), 'a']
+    constants = max(2, size // 50)
+
+    def source(i: int) -> str:
+        if rng.random() < 0.1:
+            return wires[rng.randrange(i)]
+        return wires[rng.randrange(max(i - 20, 0), i)]
+
+    lines: list[str] = []
+    for i, wire in enumerate(wires):
+        if i < constants:
+            lines.append(f'{rng.randrange(1 << 16)} -> {wire}\n')
+            continue
+        match rng.randrange(7):
+            case 0:
+                gate = f'NOT {source(i)}'
+            case 1:
+                gate = f'{source(i)} AND {source(i)}'
+            case 2:
+                gate = f'{source(i)} OR {source(i)}'
+            case 3:
+                gate = f'1 AND {source(i)}'
+            case 4:
+                gate = f'{source(i)} LSHIFT {rng.randint(1, 15)}'
+            case 5:
+                gate = f'{source(i)} RSHIFT {rng.randint(1, 15)}'
+            case _:
+                gate = source(i)
+        lines.append(f'{gate} -> {wire}\n')
+    rng.shuffle(lines)
+    yield from lines
+
+
+@generator('2015/08', 300)
+def generate_2015_08(rng: Random, size: int) -> Iterator[str]:
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    for _ in range(size):
+        tokens: list[str] = []
+        for _ in range(rng.randint(1, 30)):
+            match rng.randrange(12):
+                case 0:
+                    tokens.append('\\\\')
+                case 1:
+                    tokens.append('\\"')
+                case 2:
+                    tokens.append(f'\\x{rng.randrange(256):02x}')
+                case _:
+                    tokens.append(rng.choice(letters))
+        yield f'"{"".join(tokens)}"\n'
+
+
+@generator('2015/09', 8)
+def generate_2015_09(rng: Random, size: int) -> Iterator[str]:
+    cities = names(rng, size)
+    for i, city in enumerate(cities):
+        for other in cities[i + 1 :]:
+            yield f'{city} to {other} = {rng.randint(10, 150)}\n'
+
+
+@generator('2015/10', 10)
+def generate_2015_10(rng: Random, size: int) -> Iterator[str]:
+    yield ''.join(rng.choices('123', k=size)) + '\n'
+
+
+@generator('2015/11', 8)
+def generate_2015_11(rng: Random, size: int) -> Iterator[str]:
+    yield ''.join(rng.choices('abcdefghjkmnpqrstuvwxyz', k=size)) + '\n'
+
+
+@generator('2015/12', 5000)
+def generate_2015_12(rng: Random, size: int) -> Iterator[str]:
+    colours = ('red', 'green', 'blue', 'orange', 'violet', 'yellow')
+
+    def value(depth: int) -> object:
+        roll = rng.random()
+        if depth < 4 and roll < 0.15:
+            return [value(depth + 1) for _ in range(rng.randint(1, 6))]
+        if depth < 4 and roll < 0.3:
+            return {
+                rng.choice('abcdefghijklmnopqrstuvwxyz'): value(depth + 1)
+                for _ in range(rng.randint(1, 6))
+            }
+        if roll < 0.6:
+            return rng.randint(-50, 200)
+        return rng.choice(colours)
+
+    document = [value(0) for _ in range(max(size // 10, 1))]
+    yield json.dumps(document, separators=(',', ':')) + '\n'
+
+
+@generator('2015/13', 8)
+def generate_2015_13(rng: Random, size: int) -> Iterator[str]:
+    people = names(rng, size)
+    for person in people:
+        for other in people:
+            if other != person:
+                units = rng.randint(-100, 100)
+                change = 'gain' if units >= 0 else 'lose'
+                yield (
+                    f'{person} would {change} {abs(units)} happiness units '
+                    f'by sitting next to {other}.\n'
+                )
+
+
+@generator('2015/14', 9)
+def generate_2015_14(rng: Random, size: int) -> Iterator[str]:
+    for reindeer in names(rng, size):
+        yield (
+            f'{reindeer} can fly {rng.randint(1, 30)} km/s for '
+            f'{rng.randint(1, 20)} seconds, but then must rest for '
+            f'{rng.randint(10, 200)} seconds.\n'
+        )
+
+
+@generator('2015/15', 4)
+def generate_2015_15(rng: Random, size: int) -> Iterator[str]:
+    properties = ('capacity', 'durability', 'flavor', 'texture')
+    for i, ingredient in enumerate(names(rng, size)):
+        # Each ingredient is strong in one property and weak in the rest,
+        # as in the real puzzle, so some mixture scores above zero.
+        strong = i % len(properties)
+        scores = ', '.join(
+            f'{p} {rng.randint(2, 6) if j == strong else rng.randint(-3, 1)}'
+            for j, p in enumerate(properties)
+        )
+        yield f'{ingredient}: {scores}, calories {rng.randint(1, 9)}\n'
+
+
+@generator('2015/16', 500)
+def generate_2015_16(rng: Random, size: int) -> Iterator[str]:
+    # Every Sue but two has three properties that match neither reading of
+    # the detections; one matches exactly and one only on the ranges.
+    detections = {
+        'children': 3,
+        'cats': 7,
+        'samoyeds': 2,
+        'pomeranians': 3,
+        'akitas': 0,
+        'vizslas': 0,
+        'goldfish': 5,
+        'trees': 3,
+        'cars': 2,
+        'perfumes': 1,
+    }
+    greater = ('cats', 'trees')
+    fewer = ('pomeranians', 'goldfish')
+    exact = [p for p in detections if p not in greater + fewer]
+    size = max(size, 2)
+    part_1, part_2 = rng.sample(range(size), 2)
+    for number in range(1, size + 1):
+        if number - 1 == part_1:
+            things = {p: detections[p] for p in rng.sample(exact, 2)}
+            things['cats'] = detections['cats']
+        elif number - 1 == part_2:
+            things = {p: detections[p] for p in rng.sample(exact, 1)}
+            things['trees'] = detections['trees'] + rng.randint(1, 5)
+            things['goldfish'] = rng.randrange(detections['goldfish'])
+        else:
+            things = {}
+            for thing in rng.sample(list(detections), 3):
+                detection = detections[thing]
+                if thing in greater:
+                    count = rng.randrange(detection)
+                elif thing in fewer:
+                    count = rng.randint(detection + 1, 10)
+                else:
+                    count = rng.choice([c for c in range(11) if c != detection])
+                things[thing] = count
+        listed = ', '.join(f'{p}: {c}' for p, c in things.items())
+        yield f'Sue {number}: {listed}\n'
+
+
+@generator('2015/17', 20)
+def generate_2015_17(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield f'{rng.randint(1, 50)}\n'
+
+
+@generator('2015/18', 100)
+def generate_2015_18(rng: Random, size: int) -> Iterator[str]:
+    yield from grid_lines(cells(rng, size * size, {'#': 0.5}), size)
+
+
+@generator('2016/01', 150)
+def generate_2016_01(rng: Random, size: int) -> Iterator[str]:
+    yield ', '.join(
+        f'{rng.choice("LR")}{rng.randint(1, 200)}' for _ in range(size)
+    )
+    yield '\n'
+
+
+@generator('2016/02', 5)
+def generate_2016_02(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield ''.join(rng.choices('UDLR', k=rng.randint(300, 600))) + '\n'
+
+
+@generator('2016/03', 1800)
+def generate_2016_03(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(-(-size // 3) * 3):
+        a, b, c = (rng.randint(1, 999) for _ in range(3))
+        yield f'{a:5}{b:5}{c:5}\n'
+
+
+@generator('2017/01', 2000)
+def generate_2017_01(rng: Random, size: int) -> Iterator[str]:
+    yield from characters(rng, '123456789', size)
+    yield '\n'
+
+
+@generator('2018/01', 1000)
+def generate_2018_01(rng: Random, size: int) -> Iterator[str]:
+    # A small positive drift means some frequency repeats within a few
+    # passes, as part 2 needs.
+    size = max(size, 2)
+    changes = [rng.choice((-1, 1)) * rng.randint(1, 20) for _ in range(size)]
+    changes[-1] = rng.randint(1, 10) - sum(changes[:-1])
+    for change in changes:
+        yield f'{change:+d}\n'
+
+
+@generator('2023/09', 200)
+def generate_2023_09(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 7))]
+        values = (
+            sum(c * x**i for i, c in enumerate(coefficients))
+            for x in range(-5, 16)
+        )
+        yield ' '.join(map(str, values)) + '\n'
+
+
+@generator('2023/10', 140)
+def generate_2023_10(rng: Random, size: int) -> Iterator[str]:
+    # The loop traces the outline of a histogram of random column heights,
+    # drawn at double scale so that neighbouring runs never touch, inside a
+    # field of junk pipe.
+    size = max(size, 5)
+    columns = (size - 3) // 2
+    heights: list[int] = []
+    height = rng.randint(1, columns)
+    for _ in range(columns):
+        height = min(max(height + rng.randint(-2, 2), 1), columns)
+        heights.append(height)
+    vertices = [(x, 0) for x in range(columns + 1)]
+    vertices += [(columns, y) for y in range(1, heights[-1] + 1)]
+    for i in range(columns - 1, -1, -1):
+        y = heights[i]
+        vertices.append((i, y))
+        target = heights[i - 1] if i else 1
+        step = 1 if target > y else -1
+        vertices += [(i, v) for v in range(y + step, target + step, step)]
+    loop: list[tuple[int, int]] = []
+    for (x_1, y_1), (x_2, y_2) in zip(vertices, vertices[1:] + vertices[:1]):
+        loop.append((2 * x_1 + 1, 2 * y_1 + 1))
+        loop.append((x_1 + x_2 + 1, y_1 + y_2 + 1))
+    pipes = {
+        frozenset('NS'): '|',
+        frozenset('EW'): '-',
+        frozenset('NE'): 'L',
+        frozenset('NW'): 'J',
+        frozenset('SW'): '7',
+        frozenset('SE'): 'F',
+    }
+
+    def direction(x: int, y: int, other: tuple[int, int]) -> str:
+        other_x, other_y = other
+        if other_x != x:
+            return 'E' if other_x > x else 'W'
+        return 'S' if other_y > y else 'N'
+
+    grid = bytearray(
+        cells(rng, size * size, {c: 1 / 7 for c in '|-LJ7F'}),
+    )
+    for i, (x, y) in enumerate(loop):
+        ends = {
+            direction(x, y, loop[i - 1]),
+            direction(x, y, loop[(i + 1) % len(loop)]),
+        }
+        grid[y * size + x] = ord(pipes[frozenset(ends)])
+    x, y = rng.choice(loop)
+    grid[y * size + x] = ord('S')
+    yield from grid_lines(grid, size)
+
+
+@generator('2024/01', 1000)
+def generate_2024_01(rng: Random, size: int) -> Iterator[str]:
+    lefts = [rng.randint(10_000, 99_999) for _ in range(size)]
+    for left in lefts:
+        right = rng.choice(lefts) if rng.random() < 0.3 else None
+        if right is None:
+            right = rng.randint(10_000, 99_999)
+        yield f'{left}   {right}\n'
+
+
+@generator('2024/02', 1000)
+def generate_2024_02(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        sign = rng.choice((-1, 1))
+        levels = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            step = rng.randint(1, 3)
+            if rng.random() < 0.1:
+                step = rng.choice((0, -step, step + 3))
+            levels.append(levels[-1] + sign * step)
+        yield ' '.join(map(str, levels)) + '\n'
+
+
+@generator('2024/03', 18_000)
+def generate_2024_03(rng: Random, size: int) -> Iterator[str]:
+    junk = "abcdefghijklmnopqrstuvwxyz0123456789()[]{}<>,;:'!@#$%^&*-+?/ "
+    words = ('from', 'how', 'select', 'what', 'when', 'where', 'who', 'why')
+    length = 0
+    line: list[str] = []
+    for _ in range(size):
+        match rng.randrange(20):
+            case 0:
+                token = 'do()'
+            case 1:
+                token = "don't()"
+            case 2 | 3 | 4:
+                token = f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})'
+            case 5:
+                token = f'mul({rng.randint(1, 999)}{rng.choice(junk)}'
+            case 6:
+                token = f'{rng.choice(words)}()'
+            case _:
+                token = rng.choice(junk)
+        line.append(token)
+        length += len(token)
+        if length >= size:
+            break
+        if len(line) >= 1000:
+            yield ''.join(line)
+            line.clear()
+            if rng.random() < 0.3:
+                yield '\n'
+    yield ''.join(line) + '\n'
+
+
+@generator('2024/04', 140)
+def generate_2024_04(rng: Random, size: int) -> Iterator[str]:
+    letters = cells(rng, size * size, {'X': 0.25, 'M': 0.25, 'A': 0.25})
+    yield from grid_lines(letters.replace(b'.', b'S'), size)
+
+
+@generator('2024/05', 200)
+def generate_2024_05(rng: Random, size: int) -> Iterator[str]:
+    # Rules come from one hidden total order, so every update has a unique
+    # correct ordering.
+    pages = rng.sample(range(10, 100), 49)
+    ranks = {page: rank for rank, page in enumerate(pages)}
+    rules = [
+        (before, after)
+        for i, before in enumerate(pages)
+        for after in pages[i + 1 :]
+    ]
+    rng.shuffle(rules)
+    for before, after in rules:
+        yield f'{before}|{after}\n'
+    yield '\n'
+    for _ in range(size):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=ranks.__getitem__)
+        yield ','.join(map(str, update)) + '\n'
+
+
+def guard_walk(
+    grid: bytes | bytearray, size: int, start: int
+) -> tuple[int, int | None]:
+    """Turns the guard makes, and the obstacle that closes a loop if any."""
+    offsets = (-size, 1, size, -1)
+    position = start
+    facing = 0
+    turns: set[tuple[int, int]] = set()
+    while True:
+        x = position % size
+        offset = offsets[facing]
+        if (
+            (offset == -size and position < size)
+            or (offset == size and position >= len(grid) - size)
+            or (offset == 1 and x == size - 1)
+            or (offset == -1 and x == 0)
+        ):
+            return len(turns), None
+        if grid[position + offset] == ord('#'):
+            if (position, facing) in turns:
+                return len(turns), position + offset
+            turns.add((position, facing))
+            facing = (facing + 1) % 4
+        else:
+            position += offset
+
+
+@generator('2024/06', 130)
+def generate_2024_06(rng: Random, size: int) -> Iterator[str]:
+    # A random field traps a guard starting near the middle almost at once,
+    # so knock out whichever obstacle closes the loop until the guard walks
+    # off the map.
+    grid = bytearray(cells(rng, size * size, {'#': 0.03}))
+    quarter = size // 4
+    turns = 0
+    while turns < 4:
+        start = rng.randrange(quarter, size - quarter) * size
+        start += rng.randrange(quarter, size - quarter)
+        grid[start] = ord('.')
+        while True:
+            turns, blocker = guard_walk(grid, size, start)
+            if blocker is None:
+                break
+            grid[blocker] = ord('.')
+    grid[start] = ord('^')
+    yield from grid_lines(grid, size)
+
+
+@generator('2024/07', 850)
+def generate_2024_07(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(2, 12))]
+        if rng.random() < 0.5:
+            total = numbers[0]
+            for number in numbers[1:]:
+                match rng.randrange(3):
+                    case 0:
+                        total += number
+                    case 1:
+                        total *= number
+                    case _:
+                        total = int(f'{total}{number}')
+        else:
+            total = rng.randint(1, 10 ** rng.randint(3, 14))
+        yield f'{total}: {" ".join(map(str, numbers))}\n'
+
+
+@generator('2024/08', 50)
+def generate_2024_08(rng: Random, size: int) -> Iterator[str]:
+    frequencies = (
+        'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+    )
+    grid = bytearray(b'.') * (size * size)
+    free = rng.sample(range(len(grid)), min(len(grid), size * size // 12))
+    for i, position in enumerate(free):
+        grid[position] = ord(frequencies[i // 4 % len(frequencies)])
+    yield from grid_lines(grid, size)
+
+
+@generator('2024/09', 19_999)
+def generate_2024_09(rng: Random, size: int) -> Iterator[str]:
+    files = size // 2 + 1
+    for _ in range(files - 1):
+        yield f'{rng.randint(1, 9)}{rng.randint(0, 9)}'
+    yield f'{rng.randint(1, 9)}\n'
+
+
+@generator('2024/10', 50)
+def generate_2024_10(rng: Random, size: int) -> Iterator[str]:
+    # Diagonal ramps give plenty of trails; the noise breaks some of them.
+    for y in range(size):
+        yield ''.join(
+            str(rng.randrange(10) if rng.random() < 0.1 else (x + y) % 10)
+            for x in range(size)
+        )
+        yield '\n'
+
+
+@generator('2024/11', 8)
+def generate_2024_11(rng: Random, size: int) -> Iterator[str]:
+    stones = (rng.randrange(10 ** rng.randint(1, 7)) for _ in range(size))
+    yield ' '.join(map(str, stones)) + '\n'
+
+
+@generator('2024/12', 140)
+def generate_2024_12(rng: Random, size: int) -> Iterator[str]:
+    block = 4
+    blocks = size // block + 1
+    letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    coarse = [rng.choices(letters, k=blocks) for _ in range(blocks)]
+    for y in range(size):
+        row: list[str] = []
+        for x in range(size):
+            coarse_x = x // block
+            coarse_y = y // block
+            if rng.random() < 0.15:
+                coarse_x = min(coarse_x + rng.randint(-1, 1), blocks - 1)
+                coarse_y = min(coarse_y + rng.randint(-1, 1), blocks - 1)
+            row.append(coarse[coarse_y][coarse_x])
+        yield ''.join(row) + '\n'
+
+
+@generator('2024/13', 320)
+def generate_2024_13(rng: Random, size: int) -> Iterator[str]:
+    for i in range(size):
+        a_x, a_y, b_x, b_y = (rng.randint(10, 99) for _ in range(4))
+        if rng.random() < 0.5:
+            a = rng.randint(1, 100)
+            b = rng.randint(1, 100)
+            prize_x = a * a_x + b * b_x
+            prize_y = a * a_y + b * b_y
+        else:
+            prize_x = rng.randint(1000, 20_000)
+            prize_y = rng.randint(1000, 20_000)
+        if i:
+            yield '\n'
+        yield f'Button A: X+{a_x}, Y+{a_y}\n'
+        yield f'Button B: X+{b_x}, Y+{b_y}\n'
+        yield f'Prize: X={prize_x}, Y={prize_y}\n'
+
+
+@generator('2024/14', 500)
+def generate_2024_14(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        x = rng.randrange(101)
+        y = rng.randrange(103)
+        dx = rng.randint(-100, 100)
+        dy = rng.randint(-100, 100)
+        yield f'p={x},{y} v={dx},{dy}\n'
+
+
+@generator('2024/15', 50)
+def generate_2024_15(rng: Random, size: int) -> Iterator[str]:
+    size = max(size, 4)
+    grid = bytearray(cells(rng, size * size, {'#': 0.05, 'O': 0.25}))
+    for i in range(size):
+        grid[i] = grid[-i - 1] = ord('#')
+        grid[i * size] = grid[i * size + size - 1] = ord('#')
+    robot = rng.choice([i for i, c in enumerate(grid) if c == ord('.')])
+    grid[robot] = ord('@')
+    yield from grid_lines(grid, size)
+    yield '\n'
+    moves = 8 * size * size
+    while moves > 0:
+        count = min(moves, 1000)
+        yield ''.join(rng.choices('^v<>', k=count)) + '\n'
+        moves -= count
+
+
+def maze(rng: Random, size: int) -> bytearray:
+    """Walls with a spanning tree of passages through the odd cells."""
+    grid = bytearray(b'#') * (size * size)
+    start = size + 1
+    grid[start] = ord('.')
+    stack = [start]
+    while stack:
+        position = stack[-1]
+        x = position % size
+        y = position // size
+        options = [
+            (dx, dy)
+            for dx, dy in ((0, -2), (2, 0), (0, 2), (-2, 0))
+            if 0 < x + dx < size - 1
+            and 0 < y + dy < size - 1
+            and grid[position + dy * size + dx] == ord('#')
+        ]
+        if not options:
+            stack.pop()
+            continue
+        dx, dy = rng.choice(options)
+        grid[position + dy // 2 * size + dx // 2] = ord('.')
+        grid[position + dy * size + dx] = ord('.')
+        stack.append(position + dy * size + dx)
+    return grid
+
+
+@generator('2024/16', 141)
+def generate_2024_16(rng: Random, size: int) -> Iterator[str]:
+    # Knocking through some walls turns the tree into a maze with many
+    # competing routes.
+    size = max(size | 1, 5)
+    grid = maze(rng, size)
+    for _ in range(size * size // 20):
+        x = rng.randrange(1, size - 1)
+        y = rng.randrange(1, size - 1)
+        if (x + y) % 2:
+            grid[y * size + x] = ord('.')
+    grid[(size - 2) * size + 1] = ord('S')
+    grid[2 * size - 2] = ord('E')
+    yield from grid_lines(grid, size)
+
+
+def quine_register(program: tuple[int, ...]) -> int | None:
+    """Smallest A that makes a 2024/17 ``program`` print itself, if any.
+
+    Each pass prints a digit worked out from the low bits of A and then
+    drops three of them, so A can be built from the last digit backwards,
+    three bits at a time. The operands of the two ``bxl`` are read from the
+    program, which has the shape ``generate_2024_17`` gives it.
+    """
+    first, second = program[3], program[9]
+
+    def build(a: int, index: int) -> int | None:
+        if index < 0:
+            return a
+        for bits in range(8):
+            candidate = a << 3 | bits
+            if not candidate:
+                continue
+            b = candidate % 8 ^ first
+            if (b ^ candidate >> b ^ second) % 8 != program[index]:
+                continue
+            if (found := build(candidate, index - 1)) is not None:
+                return found
+        return None
+
+    return build(0, len(program) - 1)
+
+
+@generator('2024/17', 48)
+def generate_2024_17(rng: Random, size: int) -> Iterator[str]:
+    # Most operands give a program that no A makes print itself, which
+    # leaves part 2 without an answer, so draw until one does.
+    while True:
+        first, second = rng.randrange(8), rng.randrange(8)
+        program = (2, 4, 1, first, 7, 5, 4, 5, 1, second, 5, 5, 0, 3, 3, 0)
+        if quine_register(program) is not None:
+            break
+    yield f'Register A: {rng.randrange(1 << (size - 3), 1 << size)}\n'
+    yield 'Register B: 0\n'
+    yield 'Register C: 0\n'
+    yield '\n'
+    yield f'Program: {",".join(map(str, program))}\n'
+
+
+@generator('2024/18', 71)
+def generate_2024_18(rng: Random, size: int) -> Iterator[str]:
+    # Part 1 drops the first 1024 bytes and needs a way through afterwards,
+    # so those all miss a random staircase from corner to corner.
+    steps = [(1, 0)] * (size - 1) + [(0, 1)] * (size - 1)
+    rng.shuffle(steps)
+    x = y = 0
+    path = {(x, y)}
+    for dx, dy in steps:
+        x += dx
+        y += dy
+        path.add((x, y))
+    positions = [
+        (x, y) for y in range(size) for x in range(size) if (x, y) not in path
+    ]
+    rng.shuffle(positions)
+    rest = positions[1024:] + sorted(path - {(0, 0), (size - 1, size - 1)})
+    rng.shuffle(rest)
+    positions[1024:] = rest
+    for x, y in positions[: len(positions) * 7 // 10]:
+        yield f'{x},{y}\n'
+
+
+@generator('2024/19', 400)
+def generate_2024_19(rng: Random, size: int) -> Iterator[str]:
+    colours = 'wubrg'
+    # No towel ends in ``dead[0]`` or holds ``dead``, so no design that holds
+    # it can be made. It goes in early, as in the real inputs, where the
+    # dead ends are found without trying every way to make a long prefix.
+    dead = ''.join(rng.choices(colours, k=2))
+    towels: set[str] = set()
+    while len(towels) < 447:
+        towel = ''.join(rng.choices(colours, k=rng.randint(1, 8)))
+        if not towel.endswith(dead[0]) and dead not in towel:
+            towels.add(towel)
+    patterns = sorted(towels)
+    rng.shuffle(patterns)
+    yield ', '.join(patterns) + '\n'
+    yield '\n'
+    for _ in range(size):
+        length = rng.randint(20, 60)
+        design = ''
+        if rng.random() < 0.5:
+            design = ''.join(rng.choices(patterns, k=rng.randint(0, 1)))
+            design += dead
+        while len(design) < length:
+            design += rng.choice(patterns)
+        yield design + '\n'
+
+
+@generator('2024/20', 141)
+def generate_2024_20(rng: Random, size: int) -> Iterator[str]:
+    # A single serpentine track; cheats cut through the walls between runs.
+    size = max(size | 1, 5)
+    grid = bytearray(b'#') * (size * size)
+    for y in range(1, size - 1, 2):
+        start = y * size
+        grid[start + 1 : start + size - 1] = b'.' * (size - 2)
+        if y + 2 < size - 1:
+            x = size - 2 if y % 4 == 1 else 1
+            grid[start + size + x] = ord('.')
+    last = size - 2
+    grid[size + 1] = ord('S')
+    grid[last * size + (size - 2 if last % 4 == 1 else 1)] = ord('E')
+    yield from grid_lines(grid, size)
+
+
+@generator('2024/21', 5)
+def generate_2024_21(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield f'{rng.randrange(1000):03}A\n'
+
+
+@generator('2024/22', 2000)
+def generate_2024_22(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield f'{rng.randrange(1, 1 << 24)}\n'
+
+
+@generator('2024/23', 520)
+def generate_2024_23(rng: Random, size: int) -> Iterator[str]:
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    computers = rng.sample(
+        [a + b for a in letters for b in letters], min(max(size, 13), 676)
+    )
+    connections: set[tuple[str, str]] = set()
+
+    def connect(a: str, b: str) -> None:
+        if a != b:
+            connections.add((a, b) if a < b else (b, a))
+
+    clique = rng.sample(computers, 13)
+    for i, a in enumerate(clique):
+        for b in clique[i + 1 :]:
+            connect(a, b)
+    while len(connections) < len(computers) * 13 // 2:
+        connect(rng.choice(computers), rng.choice(computers))
+    lines = [
+        f'{a}-{b}\n' if rng.random() < 0.5 else f'{b}-{a}\n'
+        for a, b in sorted(connections)
+    ]
+    rng.shuffle(lines)
+    yield from lines
+
+
+@generator('2024/24', 45)
+def generate_2024_24(rng: Random, size: int) -> Iterator[str]:
+    # A ripple-carry adder over ``size``-bit x and y.
+    used: set[str] = set()
+
+    def internal() -> str:
+        while True:
+            name = ''.join(rng.choices('abcdefghijklmnopqrstuvw', k=3))
+            if name not in used:
+                used.add(name)
+                return name
+
+    for register in 'xy':
+        for bit in range(size):
+            yield f'{register}{bit:02}: {rng.randrange(2)}\n'
+    yield '\n'
+    gates = ['x00 XOR y00 -> z00\n']
+    carry = f'z{size:02}' if size == 1 else internal()
+    gates.append(f'x00 AND y00 -> {carry}\n')
+    for bit in range(1, size):
+        x, y, z = f'x{bit:02}', f'y{bit:02}', f'z{bit:02}'
+        half_sum, half_carry, carried = internal(), internal(), internal()
+        next_carry = f'z{size:02}' if bit == size - 1 else internal()
+        gates.append(f'{x} XOR {y} -> {half_sum}\n')
+        gates.append(f'{y} AND {x} -> {half_carry}\n')
+        gates.append(f'{carry} XOR {half_sum} -> {z}\n')
+        gates.append(f'{half_sum} AND {carry} -> {carried}\n')
+        gates.append(f'{half_carry} OR {carried} -> {next_carry}\n')
+        carry = next_carry
+    rng.shuffle(gates)
+    yield from gates
+
+
+@generator('2025/01', 4000)
+def generate_2025_01(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield f'{rng.choice("LR")}{rng.randint(1, 999)}\n'
+
+
+@final
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Arguments:
+    day: str | None
+    size: int | None
+    seed: int
+    output_path: Path | None
+
+
+def parse_args() -> Arguments:
+    parser = ArgumentParser()
+    parser.add_argument('day', nargs='?', metavar='YEAR/DAY')
+    parser.add_argument('-n', '--size', type=int)
+    parser.add_argument('-s', '--seed', default=0, type=int)
+    parser.add_argument('-o', '--output', type=Path)
+    args = parser.parse_args()
+    if args.day is not None and args.day not in GENERATORS:
+        parser.error(f'no generator for {args.day}')
+    if args.size is not None and args.size < 1:
+        parser.error('size must be at least 1')
+    return Arguments(
+        day=args.day,
+        size=args.size,
+        seed=args.seed,
+        output_path=args.output,
+    )
+
+
+def generate(day: str, size: int | None = None, seed: int = 0) -> Iterator[str]:
+    generate, default_size = GENERATORS[day]
+    return iter(generate(Random(seed), default_size if size is None else size))
+
+
+def main() -> None:
+    args = parse_args()
+    if args.day is None:
+        for day, entry in sorted(GENERATORS.items()):
+            print(f'{day}  default size {entry.size}')
+        return
+    chunks = generate(args.day, args.size, args.seed)
+    if args.output_path is None:
+        sys.stdout.writelines(chunks)
+    else:
+        with open(args.output_path, 'w', buffering=1 << 20) as file:
+            file.writelines(chunks)
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except KeyboardInterrupt:
+        raise SystemExit(1)
@@ -0,0 +1,189 @@
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Self, final, override
+
+if TYPE_CHECKING:
+    from numpy import uint8
+    from numpy.typing import NDArray
+
+
+@final
+class Grid:
+    """A rectangular grid of one-byte cells in a flat row-major buffer.
+
+    Cells are addressed either by ``(x, y)`` or by the packed index
+    ``y * width + x``, which is what the neighbour helpers work in. A grid
+    loaded from text keeps each character's byte as its cell value; use
+    ``translate`` to map those onto small codes.
+    """
+
+    __slots__ = ('cells', 'height', 'width')
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cells: bytearray | None = None,
+        fill: int = 0,
+    ) -> None:
+        if cells is None:
+            cells = bytearray([fill]) * (width * height)
+        elif len(cells) != width * height:
+            raise ValueError(
+                f'{len(cells)} cells do not fill {width}x{height} grid'
+            )
+        self.width: Final = width
+        self.height: Final = height
+        self.cells: Final = cells
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[bytes | str]) -> Self:
+        rows = [
+            line.encode() if isinstance(line, str) else line for line in lines
+        ]
+        rows = [row.rstrip(b'\r\n') for row in rows]
+        while rows and not rows[-1]:
+            rows.pop()
+        width = len(rows[0]) if rows else 0
+        for y, row in enumerate(rows):
+            if len(row) != width:
+                raise ValueError(f'row {y} has width {len(row)}, not {width}')
+        return cls(width, len(rows), bytearray().join(rows))
+
+    @classmethod
+    def load(cls, path: Path) -> Self:
+        return cls.from_lines(path.read_bytes().splitlines())
+
+    @override
+    def __str__(self) -> str:
+        return '\n'.join(
+            self.row(y).tobytes().decode('latin-1') for y in range(self.height)
+        )
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def copy(self) -> Self:
+        return type(self)(self.width, self.height, self.cells.copy())
+
+    def pack(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def unpack(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def contains(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get(self, x: int, y: int) -> int:
+        return self.cells[y * self.width + x]
+
+    def set(self, x: int, y: int, value: int) -> None:
+        self.cells[y * self.width + x] = value
+
+    def row(self, y: int) -> memoryview:
+        start = y * self.width
+        return memoryview(self.cells)[start : start + self.width]
+
+    def column(self, x: int) -> bytes:
+        return bytes(self.cells[x :: self.width])
+
+    def rows(self) -> Iterator[memoryview]:
+        return (self.row(y) for y in range(self.height))
+
+    @property
+    def offsets_4(self) -> tuple[int, int, int, int]:
+        """Index offsets to the up, right, down and left neighbours."""
+        width = self.width
+        return -width, 1, width, -1
+
+    @property
+    def offsets_8(self) -> tuple[int, ...]:
+        width = self.width
+        return (
+            -width - 1,
+            -width,
+            -width + 1,
+            -1,
+            1,
+            width - 1,
+            width,
+            width + 1,
+        )
+
+    def neighbours_4(self, index: int) -> Iterator[int]:
+        width = self.width
+        x = index % width
+        if index >= width:
+            yield index - width
+        if x + 1 < width:
+            yield index + 1
+        if index + width < len(self.cells):
+            yield index + width
+        if x:
+            yield index - 1
+
+    def neighbours_8(self, index: int) -> Iterator[int]:
+        width = self.width
+        y, x = divmod(index, width)
+        for ny in range(max(y - 1, 0), min(y + 2, self.height)):
+            start = ny * width
+            for nx in range(max(x - 1, 0), min(x + 2, width)):
+                neighbour = start + nx
+                if neighbour != index:
+                    yield neighbour
+
+    def padded(self, fill: int = 0, size: int = 1) -> Self:
+        """Copy of the grid inside a border of ``fill`` cells.
+
+        With a border at least as wide as the furthest neighbour offset,
+        ``index + offset`` never leaves the buffer or wraps onto another row
+        for interior cells, so scans can skip bounds checks entirely.
+        """
+        width = self.width + 2 * size
+        grid = type(self)(width, self.height + 2 * size, fill=fill)
+        for y in range(self.height):
+            start = (y + size) * width + size
+            grid.cells[start : start + self.width] = self.row(y)
+        return grid
+
+    def find(self, value: int, start: int = 0) -> int:
+        return self.cells.find(value, start)
+
+    def find_all(self, value: int) -> Iterator[int]:
+        cells = self.cells
+        index = cells.find(value)
+        while index != -1:
+            yield index
+            index = cells.find(value, index + 1)
+
+    def count(self, value: int) -> int:
+        return self.cells.count(value)
+
+    def translate(self, table: bytes) -> Self:
+        return type(self)(
+            self.width, self.height, bytearray(self.cells.translate(table))
+        )
+
+    def array(self) -> 'NDArray[uint8]':
+        """Zero-copy, writable ``(height, width)`` NumPy view of the cells."""
+        import numpy
+
+        return numpy.frombuffer(self.cells, dtype=numpy.uint8).reshape(
+            self.height, self.width
+        )
+
+
+def table(mapping: dict[bytes, int], default: int = 0) -> bytes:
+    """Translation table mapping single-byte characters to cell codes."""
+    codes = bytearray([default]) * 256
+    for character, code in mapping.items():
+        codes[ord(character)] = code
+    return bytes(codes)
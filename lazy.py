@@ -0,0 +1,59 @@
+from importlib.machinery import ModuleSpec
+from importlib.util import LazyLoader, find_spec, module_from_spec
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from importlib.abc import Loader
+
+
+class _ForgetOnFailure:
+    """Loader that takes its module back out of ``sys.modules`` if it fails.
+
+    The import machinery does this for ordinary imports. A lazy module only
+    runs on first use, long after ``lazy_import`` returned, so without this
+    a failed import would leave the half-run module behind for every later
+    import of the same name. It only quacks like a ``Loader``, since
+    ``importlib.abc`` costs more to import than most of the days.
+    """
+
+    def __init__(self, loader: 'Loader') -> None:
+        self.loader = loader
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        try:
+            self.loader.exec_module(module)
+        except BaseException:
+            if sys.modules.get(module.__name__) is module:
+                del sys.modules[module.__name__]
+            raise
+        # Hand back the real loader, so the module looks normally imported.
+        module.__loader__ = self.loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self.loader
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import ``name`` on first attribute access rather than now.
+
+    The module is found straight away, so a missing dependency still fails
+    at import time, but its code only runs when something is looked up on
+    it. Days that only need a library in ``main()`` therefore cost nothing
+    to import from the runner.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+    loader = LazyLoader(cast('Loader', _ForgetOnFailure(spec.loader)))
+    spec.loader = loader
+    module = module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,250 @@
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from math import inf
+from typing import Final, final
+
+type Neighbours = Callable[[int], Iterable[int]]
+
+type Edges = Callable[[int], Iterable[tuple[int, int]]]
+
+type Heuristic = Callable[[int], float]
+
+UNREACHED: Final = inf
+
+
+@final
+@dataclass(slots=True)
+class Stats:
+    expanded: int = 0
+    pushes: int = 0
+    decreases: int = 0
+
+
+@final
+class IndexedHeap:
+    """Binary min-heap over the keys ``0..size-1`` with decrease-key.
+
+    Each key is in the heap at most once, so relaxing an edge updates the
+    existing entry in place rather than pushing a duplicate and skipping the
+    stale one later.
+    """
+
+    __slots__ = ('_heap', '_positions', '_priorities')
+
+    def __init__(self, size: int) -> None:
+        self._heap: Final[list[int]] = []
+        self._positions: Final = [-1] * size
+        self._priorities: Final[list[float]] = [inf] * size
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def __contains__(self, key: int) -> bool:
+        return self._positions[key] >= 0
+
+    def push(self, key: int, priority: float) -> bool:
+        """Insert ``key`` or lower its priority; ``True`` if it was new."""
+        position = self._positions[key]
+        if position < 0:
+            self._priorities[key] = priority
+            self._heap.append(key)
+            self._sift_up(len(self._heap) - 1, key, priority)
+            return True
+        if priority < self._priorities[key]:
+            self._priorities[key] = priority
+            self._sift_up(position, key, priority)
+        return False
+
+    def pop(self) -> tuple[int, float]:
+        heap = self._heap
+        key = heap[0]
+        last = heap.pop()
+        self._positions[key] = -1
+        if heap:
+            self._sift_down(0, last, self._priorities[last])
+        return key, self._priorities[key]
+
+    def _sift_up(self, position: int, key: int, priority: float) -> None:
+        heap = self._heap
+        positions = self._positions
+        priorities = self._priorities
+        while position:
+            parent_position = (position - 1) >> 1
+            parent = heap[parent_position]
+            if priorities[parent] <= priority:
+                break
+            heap[position] = parent
+            positions[parent] = position
+            position = parent_position
+        heap[position] = key
+        positions[key] = position
+
+    def _sift_down(self, position: int, key: int, priority: float) -> None:
+        heap = self._heap
+        positions = self._positions
+        priorities = self._priorities
+        size = len(heap)
+        while (child_position := 2 * position + 1) < size:
+            child = heap[child_position]
+            child_priority = priorities[child]
+            right_position = child_position + 1
+            if right_position < size:
+                right = heap[right_position]
+                right_priority = priorities[right]
+                if right_priority < child_priority:
+                    child_position = right_position
+                    child = right
+                    child_priority = right_priority
+            if priority <= child_priority:
+                break
+            heap[position] = child
+            positions[child] = position
+            position = child_position
+        heap[position] = key
+        positions[key] = position
+
+
+def bfs(
+    size: int,
+    sources: Iterable[int],
+    neighbours: Neighbours,
+    target: int | None = None,
+    stats: Stats | None = None,
+) -> list[float]:
+    """Unit-weight distances from ``sources`` to every state below ``size``.
+
+    Stops as soon as ``target`` is reached, leaving farther states at
+    ``UNREACHED``.
+    """
+    distances: list[float] = [UNREACHED] * size
+    queue: deque[int] = deque()
+    for source in sources:
+        distances[source] = 0
+        queue.append(source)
+    pushes = len(queue)
+    expanded = 0
+    while queue:
+        state = queue.popleft()
+        expanded += 1
+        if state == target:
+            break
+        distance = distances[state] + 1
+        for neighbour in neighbours(state):
+            if distances[neighbour] == UNREACHED:
+                distances[neighbour] = distance
+                queue.append(neighbour)
+                pushes += 1
+    if stats is not None:
+        stats.expanded += expanded
+        stats.pushes += pushes
+    return distances
+
+
+def zero_one_bfs(
+    size: int,
+    sources: Iterable[int],
+    edges: Edges,
+    target: int | None = None,
+    stats: Stats | None = None,
+) -> list[float]:
+    """Shortest distances when every edge weighs zero or one."""
+    distances: list[float] = [UNREACHED] * size
+    done = bytearray(size)
+    queue: deque[int] = deque()
+    for source in sources:
+        distances[source] = 0
+        queue.append(source)
+    pushes = len(queue)
+    expanded = 0
+    while queue:
+        state = queue.popleft()
+        if done[state]:
+            continue
+        done[state] = 1
+        expanded += 1
+        if state == target:
+            break
+        distance = distances[state]
+        for neighbour, weight in edges(state):
+            next_distance = distance + weight
+            if next_distance < distances[neighbour]:
+                distances[neighbour] = next_distance
+                if weight:
+                    queue.append(neighbour)
+                else:
+                    queue.appendleft(neighbour)
+                pushes += 1
+    if stats is not None:
+        stats.expanded += expanded
+        stats.pushes += pushes
+    return distances
+
+
+def dijkstra(
+    size: int,
+    sources: Iterable[int],
+    edges: Edges,
+    target: int | None = None,
+    stats: Stats | None = None,
+) -> list[float]:
+    """Shortest distances over non-negative edge weights."""
+    return _best_first(size, sources, edges, None, target, stats)
+
+
+def astar(
+    size: int,
+    sources: Iterable[int],
+    edges: Edges,
+    target: int,
+    heuristic: Heuristic,
+    stats: Stats | None = None,
+) -> list[float]:
+    """Dijkstra guided by a consistent ``heuristic`` towards ``target``.
+
+    Only ``distances[target]`` and the distances of expanded states are
+    final when it returns.
+    """
+    return _best_first(size, sources, edges, heuristic, target, stats)
+
+
+def _best_first(
+    size: int,
+    sources: Iterable[int],
+    edges: Edges,
+    heuristic: Heuristic | None,
+    target: int | None,
+    stats: Stats | None,
+) -> list[float]:
+    distances: list[float] = [UNREACHED] * size
+    heap = IndexedHeap(size)
+    for source in sources:
+        distances[source] = 0
+        heap.push(source, 0 if heuristic is None else heuristic(source))
+    pushes = len(heap)
+    decreases = expanded = 0
+    while heap:
+        state, _ = heap.pop()
+        expanded += 1
+        if state == target:
+            break
+        distance = distances[state]
+        for neighbour, weight in edges(state):
+            next_distance = distance + weight
+            if next_distance < distances[neighbour]:
+                distances[neighbour] = next_distance
+                priority = next_distance
+                if heuristic is not None:
+                    priority += heuristic(neighbour)
+                if heap.push(neighbour, priority):
+                    pushes += 1
+                else:
+                    decreases += 1
+    if stats is not None:
+        stats.expanded += expanded
+        stats.pushes += pushes
+        stats.decreases += decreases
+    return distances
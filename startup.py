@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+from argparse import ArgumentParser
+from dataclasses import dataclass
+import subprocess
+import sys
+from typing import Final, NamedTuple, final
+
+from aoc import ROOT, Day, find_days, format_time
+
+MARKER: Final = '-- aoc day --'
+
+# Runs in a fresh interpreter under -X importtime. The marker separates the
+# imports the harness itself needs from the ones the day triggers.
+PROBE: Final = f"""
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from time import perf_counter
+spec = spec_from_file_location(sys.argv[2], sys.argv[1])
+module = module_from_spec(spec)
+sys.modules[spec.name] = module
+print({MARKER!r}, file=sys.stderr, flush=True)
+start = perf_counter()
+spec.loader.exec_module(module)
+print(perf_counter() - start)
+"""
+
+
+@final
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Arguments:
+    selectors: list[str]
+    budget: float
+    top: int
+    repeats: int
+
+
+def parse_args() -> Arguments:
+    parser = ArgumentParser()
+    parser.add_argument('selectors', nargs='*', metavar='YEAR[/DAY]')
+    parser.add_argument('-b', '--budget', default=50, type=float, metavar='MS')
+    parser.add_argument('-n', '--top', default=3, type=int)
+    parser.add_argument('-r', '--repeats', default=3, type=int)
+    args = parser.parse_args()
+    return Arguments(
+        selectors=args.selectors,
+        budget=args.budget / 1000,
+        top=args.top,
+        repeats=max(args.repeats, 1),
+    )
+
+
+@final
+class Import(NamedTuple):
+    name: str
+    cumulative: float
+
+
+@final
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Startup:
+    day: Day
+    time: float
+    imports: list[Import]
+
+
+def parse_import_times(text: str) -> list[Import]:
+    """Top-level imports the day triggered, from ``-X importtime`` output."""
+    _, _, text = text.partition(MARKER)
+    imports: list[Import] = []
+    for line in text.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        if name.startswith('  '):
+            continue
+        try:
+            imports.append(Import(name.strip(), int(cumulative) / 1_000_000))
+        except ValueError:
+            continue
+    return imports
+
+
+def probe(day: Day) -> Startup:
+    process = subprocess.run(
+        [
+            sys.executable,
+            '-X',
+            'importtime',
+            '-c',
+            PROBE,
+            str(day.path),
+            day.module_name,
+        ],
+        capture_output=True,
+        check=False,
+        cwd=ROOT,
+        text=True,
+    )
+    if process.returncode:
+        error = process.stderr.strip().splitlines()
+        raise RuntimeError(error[-1] if error else process.returncode)
+    return Startup(
+        day=day,
+        time=float(process.stdout),
+        imports=parse_import_times(process.stderr),
+    )
+
+
+def format_startup(startup: Startup, top: int, budget: float) -> str:
+    heaviest = sorted(
+        startup.imports, key=lambda i: i.cumulative, reverse=True
+    )[:top]
+    details = ', '.join(
+        f'{i.name} {format_time(i.cumulative).strip()}' for i in heaviest
+    )
+    flag = '  OVER BUDGET' if startup.time > budget else ''
+    return f'{startup.day}  import {format_time(startup.time)}  {details}{flag}'
+
+
+def main() -> None:
+    args = parse_args()
+    over_budget = 0
+    for day in find_days(args.selectors):
+        try:
+            startup = min(
+                (probe(day) for _ in range(args.repeats)),
+                key=lambda s: s.time,
+            )
+        except RuntimeError as error:
+            print(f'{day}  ! {error}')
+            continue
+        print(format_startup(startup, args.top, args.budget))
+        over_budget += startup.time > args.budget
+    if over_budget:
+        print(f'{over_budget} days over {format_time(args.budget).strip()}')
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except KeyboardInterrupt:
+        raise SystemExit(1)
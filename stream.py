@@ -0,0 +1,151 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+import re
+import sys
+from typing import BinaryIO, Final
+
+CHUNK_SIZE: Final = 1 << 20
+
+INTEGER: Final = re.compile(rb'[-+]?[0-9]+')
+
+STDIN: Final = Path('-')
+
+type Buffer = bytes | bytearray | memoryview | mmap
+
+
+def open_mapped(path: Path) -> mmap | bytes:
+    """Read-only memory map of ``path``.
+
+    Pages are only read as they are touched and the kernel can drop them
+    again under pressure, so scanning a mapped file front to back runs in
+    constant memory however large it is. ``re`` patterns and ``find`` work on
+    the map directly, though ``count`` needs ``bytes`` blocks of it. Empty
+    files cannot be mapped and come back as ``b''``.
+    """
+    with open(path, 'rb') as file:
+        try:
+            return mmap(file.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            return b''
+
+
+@contextmanager
+def mapped(path: Path) -> Iterator[mmap | bytes]:
+    """``open_mapped`` that unmaps ``path`` again on leaving the block.
+
+    Nothing may still hold on to the map by then: a ``memoryview`` of it, or
+    a live ``finditer`` over it, makes closing it raise ``BufferError``.
+    """
+    buffer = open_mapped(path)
+    try:
+        yield buffer
+    finally:
+        if isinstance(buffer, mmap):
+            buffer.close()
+
+
+def read_chunks(file: BinaryIO, size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    while chunk := file.read(size):
+        yield chunk
+
+
+def chunks(path: Path, size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """``path`` in blocks of ``size`` bytes; ``-`` reads standard input."""
+    if path == STDIN:
+        yield from read_chunks(sys.stdin.buffer, size)
+        return
+    with mapped(path) as buffer:
+        yield from buffer_chunks(buffer, size=size)
+
+
+def buffer_chunks(
+    buffer: Buffer,
+    start: int = 0,
+    end: int | None = None,
+    size: int = CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """``buffer[start:end]`` in blocks of ``size`` bytes."""
+    end = len(buffer) if end is None else end
+    for block_start in range(start, end, size):
+        yield bytes(buffer[block_start : min(block_start + size, end)])
+
+
+def line_blocks(path: Path, size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """``path`` in blocks of about ``size`` bytes that end on a line break.
+
+    Only a line longer than ``size`` makes a block bigger than that.
+    """
+    with mapped(path) as buffer:
+        yield from buffer_line_blocks(buffer, size=size)
+
+
+def buffer_line_blocks(
+    buffer: bytes | bytearray | mmap,
+    start: int = 0,
+    end: int | None = None,
+    size: int = CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """``buffer[start:end]`` as in ``line_blocks``.
+
+    ``start`` and ``end`` should themselves be on line boundaries, as
+    ``line_bounds`` gives them.
+    """
+    end = len(buffer) if end is None else end
+    while start < end:
+        stop = min(start + size, end)
+        if stop < end:
+            newline = buffer.rfind(b'\n', start, stop)
+            if newline == -1:
+                newline = buffer.find(b'\n', stop, end)
+            stop = end if newline == -1 else newline + 1
+        yield bytes(buffer[start:stop])
+        start = stop
+
+
+def line_bounds(buffer: bytes | bytearray | mmap, parts: int) -> list[int]:
+    """Offsets cutting ``buffer`` into ``parts`` spans of whole lines.
+
+    Spans are about equal in bytes; each cut moves forward to just past the
+    next line break, so some spans may be empty.
+    """
+    size = len(buffer)
+    bounds = [0]
+    for part in range(1, parts):
+        newline = buffer.find(b'\n', max(size * part // parts, bounds[-1]))
+        bounds.append(size if newline == -1 else newline + 1)
+    bounds.append(size)
+    return bounds
+
+
+def lines(path: Path) -> Iterator[bytes]:
+    """Lines of ``path`` without their terminators, as ``bytes``."""
+    with mapped(path) as buffer:
+        size = len(buffer)
+        start = 0
+        while start < size:
+            end = buffer.find(b'\n', start)
+            if end == -1:
+                end = size
+            line = buffer[start:end]
+            yield line[:-1] if line.endswith(b'\r') else line
+            start = end + 1
+
+
+def integers(buffer: Buffer) -> Iterator[int]:
+    """Every signed decimal integer in ``buffer``, in order."""
+    return (int(match[0]) for match in INTEGER.finditer(buffer))
+
+
+def file_integers(path: Path) -> Iterator[int]:
+    with mapped(path) as buffer:
+        yield from integers(buffer)
+
+
+def digits(path: Path) -> Iterator[int]:
+    """Value of each ASCII digit in ``path``, skipping everything else."""
+    for chunk in chunks(path):
+        for byte in chunk:
+            if 0x30 <= byte <= 0x39:
+                yield byte - 0x30